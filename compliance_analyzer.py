@@ -1,15 +1,234 @@
 import os
-import json
+import orjson
 import random
+import asyncio
+import threading
+import time
+import ahocorasick
+import numpy as np
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from compliance_keywords import COMPLIANCE_KEYWORDS, RISK_LEVELS
-from redis_cache import get_cached_result, cache_result
+from redis_cache import get_cached_result, cache_result, get_cached_many, cache_many
 import streamlit as st
+from openai import AsyncOpenAI
 from utils import get_openai_client
 
 # Initialize OpenAI client
 client = get_openai_client()
 
+# US-specific terms
+US_TERMS = ["sec", "finra", "dodd-frank", "securities act", "exchange act", "federal reserve", 
+            "cftc", "us treasury", "fasb", "us gaap", "sarbanes-oxley", "sox", "united states"]
+
+# EU-specific terms
+EU_TERMS = ["esma", "eba", "ecb", "mifid", "gdpr", "emir", "european union", "eu", "eba", 
+            "european commission", "ifrs", "brexit", "european central bank"]
+
+# India-specific terms
+INDIA_TERMS = ["sebi", "rbi", "companies act india", "indian securities", "nse india", "bse india",
+              "reserve bank of india", "ministry of corporate affairs india", "fema india", 
+              "indian regulatory", "indian compliance", "india"]
+
+# Asia-specific terms (excluding India)
+ASIA_TERMS = ["mas singapore", "hkma", "csrc china", "jfsa japan", "bank of japan", "pboc",
+             "korean fsc", "asian regulatory", "apac compliance", "asian markets",
+             "singapore exchange", "hong kong exchange", "tokyo exchange", "shanghai exchange",
+             "asian development bank", "asean"]
+
+JURISDICTION_TERMS = {
+    "US": US_TERMS,
+    "EU": EU_TERMS,
+    "INDIA": INDIA_TERMS,
+    "ASIA": ASIA_TERMS
+}
+
+def _build_term_automaton():
+    """
+    Build one Aho-Corasick automaton over the compliance keywords and jurisdiction terms
+    Each lowercased term maps to the keywords and jurisdictions it counts towards
+    """
+    term_keywords = {}
+    term_jurisdictions = {}
+    for keyword in COMPLIANCE_KEYWORDS:
+        term_keywords.setdefault(keyword.lower(), []).append(keyword)
+    for jurisdiction, terms in JURISDICTION_TERMS.items():
+        for term in terms:
+            term_jurisdictions.setdefault(term, []).append(jurisdiction)
+    
+    automaton = ahocorasick.Automaton()
+    for term in term_keywords.keys() | term_jurisdictions.keys():
+        automaton.add_word(term, (term, term_keywords.get(term, []), term_jurisdictions.get(term, [])))
+    automaton.make_automaton()
+    return automaton
+
+TERM_AUTOMATON = _build_term_automaton()
+
+# Column of each compliance keyword in the hit matrix, and the risk value of each column
+KEYWORD_COLUMNS = {keyword: column for column, keyword in enumerate(COMPLIANCE_KEYWORDS)}
+KEYWORD_RISK_VALUES = np.array([RISK_LEVELS[risk_level] for risk_level in COMPLIANCE_KEYWORDS.values()])
+
+# Risk category of each keyword (its first word)
+KEYWORD_CATEGORIES = {keyword: keyword.split()[0] if " " in keyword else keyword for keyword in COMPLIANCE_KEYWORDS}
+
+def _is_whole_word(text, start, end):
+    """
+    Check that text[start:end] is not part of a longer word (a regex word boundary on both ends)
+    """
+    before = text[start - 1] if start > 0 else " "
+    after = text[end] if end < len(text) else " "
+    return not (before.isalnum() or before == "_") and not (after.isalnum() or after == "_")
+
+def scan_compliance_terms(content_lower):
+    """
+    Scan lowercased content once for all compliance keywords and jurisdiction terms
+    Returns the matched keywords (in COMPLIANCE_KEYWORDS order) and the term count per jurisdiction
+    Jurisdiction terms only count as whole words, so "eu" does not match inside "europe"
+    """
+    # A term counts once per document, however often it occurs
+    found_keywords = set()
+    found_jurisdiction_terms = {}
+    for end, (term, keywords, jurisdictions) in TERM_AUTOMATON.iter(content_lower):
+        found_keywords.update(keywords)
+        if jurisdictions and term not in found_jurisdiction_terms:
+            if _is_whole_word(content_lower, end - len(term) + 1, end + 1):
+                found_jurisdiction_terms[term] = jurisdictions
+    
+    counts = {jurisdiction: 0 for jurisdiction in JURISDICTION_TERMS}
+    for jurisdictions in found_jurisdiction_terms.values():
+        for jurisdiction in jurisdictions:
+            counts[jurisdiction] += 1
+    
+    keywords = [keyword for keyword in COMPLIANCE_KEYWORDS if keyword in found_keywords]
+    return keywords, counts
+
+# Risk analyses are cached in Redis, with a bounded in-process LRU in front of it
+RISK_CACHE_TTL = 300
+RISK_L1_CACHE_SIZE = 2048
+_risk_l1_cache = OrderedDict()  # doc_id -> (expires_at, result)
+_risk_l1_lock = threading.Lock()
+
+def _remember_risk(doc_id, result):
+    """
+    Store a risk analysis in the in-process cache, evicting the least recently used entry
+    """
+    with _risk_l1_lock:
+        _risk_l1_cache[doc_id] = (time.monotonic() + RISK_CACHE_TTL, result)
+        _risk_l1_cache.move_to_end(doc_id)
+        if len(_risk_l1_cache) > RISK_L1_CACHE_SIZE:
+            _risk_l1_cache.popitem(last=False)
+
+def get_cached_risk(doc_id):
+    """
+    Get a cached risk analysis, checking the in-process cache before Redis
+    """
+    with _risk_l1_lock:
+        entry = _risk_l1_cache.get(doc_id)
+        if entry and entry[0] > time.monotonic():
+            _risk_l1_cache.move_to_end(doc_id)
+            return entry[1]
+    
+    cached_result = get_cached_result(f"risk:{doc_id}")
+    if not cached_result:
+        return None
+    
+    result = orjson.loads(cached_result)
+    _remember_risk(doc_id, result)
+    return result
+
+def cache_risk(doc_id, result):
+    """
+    Cache a risk analysis in Redis and in the in-process cache
+    """
+    cache_result(f"risk:{doc_id}", orjson.dumps(result), ttl=RISK_CACHE_TTL)
+    _remember_risk(doc_id, result)
+
+def get_cached_risks(doc_ids):
+    """
+    Get cached risk analyses for several documents, fetching in-process misses from Redis in one round-trip
+    Returns a dict of the documents that were found
+    """
+    found = {}
+    missing = []
+    now = time.monotonic()
+    with _risk_l1_lock:
+        for doc_id in doc_ids:
+            entry = _risk_l1_cache.get(doc_id)
+            if entry and entry[0] > now:
+                _risk_l1_cache.move_to_end(doc_id)
+                found[doc_id] = entry[1]
+            else:
+                missing.append(doc_id)
+    
+    if missing:
+        cached_results = get_cached_many([f"risk:{doc_id}" for doc_id in missing])
+        for doc_id, cached_result in zip(missing, cached_results):
+            if cached_result:
+                result = orjson.loads(cached_result)
+                _remember_risk(doc_id, result)
+                found[doc_id] = result
+    
+    return found
+
+def cache_risks(results):
+    """
+    Cache several risk analyses, keyed by document ID, in one Redis round-trip
+    """
+    if not results:
+        return
+    
+    cache_many({f"risk:{doc_id}": orjson.dumps(result) for doc_id, result in results.items()}, ttl=RISK_CACHE_TTL)
+    for doc_id, result in results.items():
+        _remember_risk(doc_id, result)
+
+# Most documents are classified by the small model; long, high-risk ones are escalated for confirmation
+MODEL_SMALL = "gpt-4o-mini"
+MODEL_BIG = "gpt-4o"
+ESCALATION_RISK_SCORE = 0.6
+ESCALATION_MIN_LENGTH = 3000
+
+def _needs_escalation(content, result):
+    """
+    Check whether a small-model result should be confirmed by the larger model
+    """
+    try:
+        risk_score = float(result.get("risk_score") or 0)
+    except (TypeError, ValueError):
+        return False
+    return risk_score >= ESCALATION_RISK_SCORE and len(content) > ESCALATION_MIN_LENGTH
+
+def _request_risk_analysis(content, model):
+    """
+    Ask an OpenAI model for the risk analysis of a single document
+    """
+    response = client.chat.completions.create(
+        model=model,
+        messages=[
+            {
+                "role": "system",
+                "content": """You are a financial compliance expert. Analyze the document for compliance risks.
+                Focus on identifying potential issues related to securities regulations, financial reporting, 
+                money laundering, insider trading, and other financial compliance areas.
+                Return a JSON object with the following fields:
+                - risk_score: A float between 0 and 1 indicating the overall risk level
+                - risk_categories: Array of risk categories identified (e.g. "insider trading", "AML", etc.)
+                - key_findings: Array of specific concerning elements found
+                - jurisdiction: Either "US", "EU", or "GLOBAL" based on regulatory context
+                - summary: A brief summary of the compliance implications
+                """
+            },
+            {
+                "role": "user",
+                "content": content
+            }
+        ],
+        response_format={"type": "json_object"},
+        max_tokens=1000
+    )
+    
+    return orjson.loads(response.choices[0].message.content)
+
 def analyze_document_risk(doc_id, content):
     """
     Analyze document content for compliance risk
@@ -17,160 +236,305 @@ def analyze_document_risk(doc_id, content):
     In a production environment, this would use more sophisticated ML/AI analysis
     """
     # Check cache first
-    cache_key = f"risk:{doc_id}"
-    cached_result = get_cached_result(cache_key)
+    cached_result = get_cached_risk(doc_id)
     if cached_result:
-        return json.loads(cached_result)
+        return cached_result
     
     # For demo purposes, if the content is short, use a simplified approach
     if len(content) < 200:
         result = simplified_risk_analysis(content)
-        cache_result(cache_key, json.dumps(result))
+        cache_risk(doc_id, result)
         return result
     
     try:
         if not client:
             # Fallback to simplified analysis if OpenAI client is not available
             result = simplified_risk_analysis(content)
-            cache_result(cache_key, json.dumps(result))
+            cache_risk(doc_id, result)
             return result
             
-        # Use OpenAI to analyze the document
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {
-                    "role": "system",
-                    "content": """You are a financial compliance expert. Analyze the document for compliance risks.
-                    Focus on identifying potential issues related to securities regulations, financial reporting, 
-                    money laundering, insider trading, and other financial compliance areas.
-                    Return a JSON object with the following fields:
-                    - risk_score: A float between 0 and 1 indicating the overall risk level
-                    - risk_categories: Array of risk categories identified (e.g. "insider trading", "AML", etc.)
-                    - key_findings: Array of specific concerning elements found
-                    - jurisdiction: Either "US", "EU", or "GLOBAL" based on regulatory context
-                    - summary: A brief summary of the compliance implications
-                    """
-                },
-                {
-                    "role": "user",
-                    "content": content
-                }
-            ],
-            response_format={"type": "json_object"},
-            max_tokens=1000
-        )
-        
-        result = json.loads(response.choices[0].message.content)
+        # Use the small model first and confirm long, high-risk documents with the larger one
+        result = _request_risk_analysis(content, MODEL_SMALL)
+        if _needs_escalation(content, result):
+            result = _request_risk_analysis(content, MODEL_BIG)
         
         # Cache the result
-        cache_result(cache_key, json.dumps(result))
+        cache_risk(doc_id, result)
         
         return result
     except Exception as e:
         print(f"Error in analyze_document_risk: {str(e)}")
         # Fallback to simplified analysis
         result = simplified_risk_analysis(content)
-        cache_result(cache_key, json.dumps(result))
+        cache_risk(doc_id, result)
         return result
 
+# Optional logistic-regression risk head over document embeddings, trained offline on risk labels
+# (an .npz file with weight vector "W" and bias "b"); without it every document goes to the LLM
+RISK_HEAD_PATH = os.environ.get(
+    "RISK_HEAD_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "risk_head.npz")
+)
+RISK_HEAD_CONFIDENCE = 0.35  # Minimum |p - 0.5| for a head prediction to be trusted
+
+def _load_risk_head(path):
+    """
+    Load the risk head weights, or None if they are not available
+    """
+    if not os.path.exists(path):
+        return None
+    
+    try:
+        weights = np.load(path)
+        return weights["W"].astype(np.float64), float(weights["b"])
+    except Exception as e:
+        print(f"Error loading risk head: {str(e)}")
+        return None
+
+risk_head = _load_risk_head(RISK_HEAD_PATH)
+
+def predict_risk_from_embedding(embedding):
+    """
+    Score a document from its embedding with the risk head
+    Returns None when there is no head, no usable embedding, or the prediction is not confident
+    """
+    if risk_head is None or embedding is None:
+        return None
+    
+    W, b = risk_head
+    x = np.asarray(embedding, dtype=np.float64)
+    if x.shape != W.shape or not x.any():
+        # Missing or zero (fallback) embeddings carry no signal
+        return None
+    
+    risk_score = float(1 / (1 + np.exp(-(W @ x + b))))
+    if abs(risk_score - 0.5) < RISK_HEAD_CONFIDENCE:
+        return None
+    return risk_score
+
+# Maximum number of documents sent to OpenAI in a single batched analysis request
+ANALYSIS_BATCH_SIZE = 5
+
+# Maximum number of batched analysis requests in flight at once
+ANALYSIS_MAX_CONCURRENCY = 8
+
+async def _analyze_batch_async(aclient, semaphore, batch, model):
+    """
+    Analyze one batch of documents with a single OpenAI request
+    Returns the analysis for each document ID the model answered for
+    """
+    try:
+        async with semaphore:
+            response = await aclient.chat.completions.create(
+                model=model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": """You are a financial compliance expert. Analyze each document for compliance risks.
+                        Focus on identifying potential issues related to securities regulations, financial reporting, 
+                        money laundering, insider trading, and other financial compliance areas.
+                        The input is a JSON array of documents with "id" and "content" fields.
+                        Return a JSON object {"results": [...]} with one entry per document containing:
+                        - id: The id of the analyzed document
+                        - risk_score: A float between 0 and 1 indicating the overall risk level
+                        - risk_categories: Array of risk categories identified (e.g. "insider trading", "AML", etc.)
+                        - key_findings: Array of specific concerning elements found
+                        - jurisdiction: Either "US", "EU", or "GLOBAL" based on regulatory context
+                        - summary: A brief summary of the compliance implications
+                        """
+                    },
+                    {
+                        "role": "user",
+                        "content": orjson.dumps([{"id": doc["id"], "content": doc["content"]} for doc in batch]).decode()
+                    }
+                ],
+                response_format={"type": "json_object"},
+                max_tokens=1000 * len(batch)
+            )
+        
+        batch_results = orjson.loads(response.choices[0].message.content).get("results", [])
+        return {str(result.pop("id", "")): result for result in batch_results if isinstance(result, dict)}
+    except Exception as e:
+        print(f"Error in analyze_documents_risk_batch: {str(e)}")
+        return {}
+
+async def _analyze_batches_async(documents, model):
+    """
+    Analyze documents in batches of ANALYSIS_BATCH_SIZE, running up to ANALYSIS_MAX_CONCURRENCY batches at once
+    Returns the analysis for each document ID the model answered for
+    """
+    batches = [documents[start:start + ANALYSIS_BATCH_SIZE] for start in range(0, len(documents), ANALYSIS_BATCH_SIZE)]
+    semaphore = asyncio.Semaphore(ANALYSIS_MAX_CONCURRENCY)
+    
+    # The async client is tied to this event loop, so open and close it per run
+    async with AsyncOpenAI(api_key=client.api_key) as aclient:
+        batch_results = await asyncio.gather(*[
+            _analyze_batch_async(aclient, semaphore, batch, model)
+            for batch in batches
+        ])
+    
+    analyzed = {}
+    for batch_result in batch_results:
+        analyzed.update(batch_result)
+    return analyzed
+
+def analyze_documents_risk_batch(documents, embeddings=None):
+    """
+    Analyze several documents for compliance risk with one OpenAI request per batch
+    Cached and short documents are handled locally; results are returned in input order
+    If the documents' embeddings are passed, confident risk head predictions skip the LLM
+    """
+    results = {}
+    new_results = {}
+    pending = []
+    simplified = []
+    head_scores = {}
+    
+    cached_results = get_cached_risks([doc["id"] for doc in documents])
+    for doc, embedding in zip(documents, embeddings or [None] * len(documents)):
+        cached_result = cached_results.get(doc["id"])
+        if cached_result:
+            results[doc["id"]] = cached_result
+        elif len(doc["content"]) < 200 or not client:
+            simplified.append(doc)
+        else:
+            head_score = predict_risk_from_embedding(embedding)
+            if head_score is not None:
+                # The keyword analysis supplies the descriptive fields, the head the score
+                head_scores[doc["id"]] = head_score
+                simplified.append(doc)
+            else:
+                pending.append(doc)
+    
+    analyzed = {}
+    if pending:
+        # Send the uncached documents to the small model, several batches at a time
+        analyzed = asyncio.run(_analyze_batches_async(pending, MODEL_SMALL))
+        
+        # Confirm long, high-risk documents with the larger model
+        escalated = [
+            doc for doc in pending
+            if str(doc["id"]) in analyzed and _needs_escalation(doc["content"], analyzed[str(doc["id"])])
+        ]
+        if escalated:
+            analyzed.update(asyncio.run(_analyze_batches_async(escalated, MODEL_BIG)))
+    
+    for doc in pending:
+        result = analyzed.get(str(doc["id"]))
+        if result:
+            new_results[doc["id"]] = result
+            results[doc["id"]] = result
+        else:
+            # Fall back to simplified analysis for anything the model left out
+            simplified.append(doc)
+    
+    # Score every locally analyzed document together
+    simplified_results = batch_simplified_risk(
+        [doc["content"] for doc in simplified],
+        [head_scores.get(doc["id"]) for doc in simplified]
+    )
+    for doc, result in zip(simplified, simplified_results):
+        new_results[doc["id"]] = result
+        results[doc["id"]] = result
+    
+    cache_risks(new_results)
+    return [results[doc["id"]] for doc in documents]
+
 def simplified_risk_analysis(content):
     """
     Simplified risk analysis based on keyword matching
     """
-    content_lower = content.lower()
+    return batch_simplified_risk([content])[0]
+
+def batch_simplified_risk(contents, score_overrides=None):
+    """
+    Simplified keyword-based risk analysis for several documents at once
+    Risk scores for all documents are computed together from a document x keyword hit matrix
+    score_overrides (one entry per document, None to keep the keyword score) replaces the
+    keyword score, e.g. with the risk head's prediction, before the summary is written
+    """
+    scans = []
+    hits = np.zeros((len(contents), len(COMPLIANCE_KEYWORDS)), dtype=bool)
+    
+    for row, content in enumerate(contents):
+        content_lower = content.lower()
+        
+        # One pass finds both the keywords and the jurisdiction terms
+        matched_keywords, jurisdiction_counts = scan_compliance_terms(content_lower)
+        hits[row, [KEYWORD_COLUMNS[keyword] for keyword in matched_keywords]] = True
+        scans.append((content_lower, matched_keywords, jurisdiction_counts))
     
-    # Count keyword matches and their risk levels
-    matches = {}
-    total_risk = 0
-    max_risk = 0
-    risk_categories = []
+    # Weighted approach: 70% from max risk, 30% from average of the matched keywords
+    risk_values = np.where(hits, KEYWORD_RISK_VALUES, 0.0)
+    match_counts = hits.sum(axis=1)
+    max_risk = risk_values.max(axis=1, initial=0.0)
+    avg_risk = risk_values.sum(axis=1) / np.maximum(match_counts, 1)
+    risk_scores = np.where(match_counts > 0, 0.7 * max_risk + 0.3 * avg_risk, 0.1)  # 0.1 is the base risk level
     
-    for keyword, risk_level in COMPLIANCE_KEYWORDS.items():
-        if keyword.lower() in content_lower:
-            matches[keyword] = RISK_LEVELS[risk_level]
-            risk_value = RISK_LEVELS[risk_level]
-            total_risk += risk_value
-            max_risk = max(max_risk, risk_value)
-            
-            # Add risk category
-            category = keyword.split()[0] if " " in keyword else keyword
+    if score_overrides is None:
+        score_overrides = [None] * len(contents)
+    
+    results = []
+    for content, (content_lower, matched_keywords, jurisdiction_counts), risk_score, override in zip(
+        contents, scans, risk_scores, score_overrides
+    ):
+        risk_score = float(risk_score) if override is None else float(override)
+        
+        # Risk categories in keyword order, without duplicates
+        risk_categories = []
+        for keyword in matched_keywords:
+            category = KEYWORD_CATEGORIES[keyword]
             if category not in risk_categories:
                 risk_categories.append(category)
-    
-    # Calculate overall risk score
-    if not matches:
-        risk_score = 0.1  # Base risk level
-    else:
-        # Weighted approach: 70% from max risk, 30% from average
-        avg_risk = total_risk / len(matches) if matches else 0
-        risk_score = 0.7 * max_risk + 0.3 * avg_risk
-    
-    # Determine jurisdiction
-    jurisdiction = categorize_by_jurisdiction(content)
-    
-    # Create key findings
-    key_findings = [f"Found potential {keyword} issue" for keyword in matches.keys()]
-    
-    # Generate a simple summary
-    if matches:
-        keywords_list = ", ".join(list(matches.keys())[:3])
-        summary = f"Document contains {len(matches)} compliance-related keywords including {keywords_list}."
-        if risk_score > 0.7:
-            summary += " This document indicates high compliance risk and requires immediate review."
-        elif risk_score > 0.4:
-            summary += " This document indicates moderate compliance risk and should be reviewed."
+        
+        # Determine jurisdiction
+        jurisdiction = categorize_by_jurisdiction(content, content_lower, jurisdiction_counts)
+        
+        # Create key findings
+        key_findings = [f"Found potential {keyword} issue" for keyword in matched_keywords]
+        
+        # Generate a simple summary, worded from the final risk score
+        if matched_keywords or override is not None:
+            if matched_keywords:
+                keywords_list = ", ".join(matched_keywords[:3])
+                summary = f"Document contains {len(matched_keywords)} compliance-related keywords including {keywords_list}."
+            else:
+                summary = "Document contains no specific compliance keywords."
+            if risk_score > 0.7:
+                summary += " This document indicates high compliance risk and requires immediate review."
+            elif risk_score > 0.4:
+                summary += " This document indicates moderate compliance risk and should be reviewed."
+            else:
+                summary += " This document indicates low compliance risk but should still be monitored."
         else:
-            summary += " This document indicates low compliance risk but should still be monitored."
-    else:
-        summary = "No specific compliance risks identified in this document."
+            summary = "No specific compliance risks identified in this document."
+        
+        results.append({
+            "risk_score": risk_score,
+            "risk_categories": risk_categories,
+            "key_findings": key_findings,
+            "jurisdiction": jurisdiction,
+            "summary": summary
+        })
     
-    return {
-        "risk_score": risk_score,
-        "risk_categories": risk_categories,
-        "key_findings": key_findings,
-        "jurisdiction": jurisdiction,
-        "summary": summary
-    }
+    return results
 
-def categorize_by_jurisdiction(content):
+def categorize_by_jurisdiction(content, content_lower=None, counts=None):
     """
     Determine whether a document relates to US, EU, India, Asia or Global jurisdiction
+    content_lower and counts (from scan_compliance_terms) can be passed in if already computed
     """
-    content_lower = content.lower()
-    
-    # US-specific terms
-    us_terms = ["sec", "finra", "dodd-frank", "securities act", "exchange act", "federal reserve", 
-                "cftc", "us treasury", "fasb", "us gaap", "sarbanes-oxley", "sox", "united states"]
+    if content_lower is None and counts is None:
+        # Standalone lookups (e.g. re-polled news articles) are memoized on the content
+        return _categorize_content(content)
     
-    # EU-specific terms
-    eu_terms = ["esma", "eba", "ecb", "mifid", "gdpr", "emir", "european union", "eu", "eba", 
-                "european commission", "ifrs", "brexit", "european central bank"]
+    if content_lower is None:
+        content_lower = content.lower()
     
-    # India-specific terms
-    india_terms = ["sebi", "rbi", "companies act india", "indian securities", "nse india", "bse india",
-                  "reserve bank of india", "ministry of corporate affairs india", "fema india", 
-                  "indian regulatory", "indian compliance", "india"]
-    
-    # Asia-specific terms (excluding India)
-    asia_terms = ["mas singapore", "hkma", "csrc china", "jfsa japan", "bank of japan", "pboc",
-                 "korean fsc", "asian regulatory", "apac compliance", "asian markets",
-                 "singapore exchange", "hong kong exchange", "tokyo exchange", "shanghai exchange",
-                 "asian development bank", "asean"]
-    
-    us_count = sum(1 for term in us_terms if term in content_lower)
-    eu_count = sum(1 for term in eu_terms if term in content_lower)
-    india_count = sum(1 for term in india_terms if term in content_lower)
-    asia_count = sum(1 for term in asia_terms if term in content_lower)
+    if counts is None:
+        counts = scan_compliance_terms(content_lower)[1]
     
     # Find the jurisdiction with the most matches
-    counts = {
-        "US": us_count,
-        "EU": eu_count,
-        "INDIA": india_count,
-        "ASIA": asia_count
-    }
-    
     max_count = max(counts.values())
     if max_count > 0:
         # Get the jurisdiction with the highest count
@@ -190,6 +554,13 @@ def categorize_by_jurisdiction(content):
             # Default to global if can't determine
             return "GLOBAL"
 
+@lru_cache(maxsize=4096)
+def _categorize_content(content):
+    """
+    Memoized jurisdiction lookup for a document's content
+    """
+    return categorize_by_jurisdiction(content, content.lower())
+
 def get_risk_level_label(risk_score):
     """
     Convert a risk score to a human-readable label
@@ -1,19 +1,23 @@
 import pathway as pw
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import random
 import streamlit as st
-from utils import get_openai_client
+from cachetools import TTLCache
+from utils import get_openai_client, stable_hash
 
 from compliance_keywords import COMPLIANCE_KEYWORDS
-from vector_store import update_vector_index
-from compliance_analyzer import analyze_document_risk, categorize_by_jurisdiction
-from notification_service import send_notification
-from mock_websocket import start_mock_websocket_server
+from vector_store import update_vector_index, generate_embeddings_batch
+from compliance_analyzer import analyze_document_risk, analyze_documents_risk_batch, categorize_by_jurisdiction
+from notification_service import queue_sms_notification
+from mock_websocket import start_mock_websocket_server, stop_mock_websocket_server
 
 # Initialize OpenAI client
 client = get_openai_client()
@@ -23,9 +27,61 @@ SEC_API_ENDPOINT = "https://www.sec.gov/cgi-bin/browse-edgar"
 NEWS_API_ENDPOINT = "https://newsapi.org/v2/everything"
 NEWS_API_KEY = os.environ.get("NEWS_API_KEY")
 
+# Persistent HTTP session so each poll reuses pooled keep-alive connections
+# (requests already asks for gzip/deflate-encoded responses by default)
+HTTP_TIMEOUT = (3, 10)  # (connect, read) seconds
+http_session = requests.Session()
+http_session.headers.update({"User-Agent": "FinancialComplianceCopilot/0.1 (compliance-monitoring)"})
+http_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+))
+
+# Keywords sampled into the mock documents
+KEYWORD_LIST = list(COMPLIANCE_KEYWORDS.keys())
+
+# Seconds between polls of each source
+SEC_POLL_INTERVAL = 300
+NEWS_POLL_INTERVAL = 120
+
 # Global variables
 running = False
+stop_event = threading.Event()  # Set to wake the ingestion thread when the pipeline stops
+http_validators = {}  # ETag / Last-Modified of the last response from each endpoint
 pipeline_thread = None
+# Recipient for alerts raised by the background pipeline. There is one pipeline per
+# process, so this is shared by every session: the last number set wins.
+alert_phone_number = None
+
+# Alerts already queued in the last ALERT_DEDUP_WINDOW seconds, keyed by document,
+# risk bucket and recipient, so repeats of the same alert don't send another SMS
+ALERT_DEDUP_WINDOW = 300
+recent_alerts = TTLCache(maxsize=10_000, ttl=ALERT_DEDUP_WINDOW)
+recent_alerts_lock = threading.Lock()
+
+def conditional_get(url, params):
+    """
+    GET a URL with If-None-Match / If-Modified-Since from the previous response
+    Returns None when the server reports the content is unchanged (304)
+    """
+    headers = {}
+    validators = http_validators.get(url, {})
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    
+    response = http_session.get(url, params=params, headers=headers, timeout=HTTP_TIMEOUT)
+    if response.status_code == 304:
+        return None
+    
+    if response.status_code == 200:
+        http_validators[url] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }
+    return response
 
 def fetch_sec_filings(company_ticker=None, form_type="10-K,10-Q,8-K", count=10):
     """
@@ -44,9 +100,12 @@ def fetch_sec_filings(company_ticker=None, form_type="10-K,10-Q,8-K", count=10):
         if form_type:
             params["type"] = form_type
             
-        response = requests.get(SEC_API_ENDPOINT, params=params)
+        response = conditional_get(SEC_API_ENDPOINT, params)
         
-        if response.status_code == 200:
+        if response is None:
+            # Nothing new since the last poll
+            return []
+        elif response.status_code == 200:
             # In a production environment, we would parse the XML response
             # For this prototype, we'll simulate the documents
             documents = []
@@ -55,12 +114,11 @@ def fetch_sec_filings(company_ticker=None, form_type="10-K,10-Q,8-K", count=10):
                 company = f"COMPANY-{random.randint(1000, 9999)}"
                 
                 # Generate some random content with compliance keywords
-                keywords = list(COMPLIANCE_KEYWORDS.keys())
-                selected_keywords = random.sample(keywords, k=random.randint(1, 5))
+                selected_keywords = random.sample(KEYWORD_LIST, k=random.randint(1, 5))
                 
-                content = f"This is a {doc_type} filing for {company}. "
-                for keyword in selected_keywords:
-                    content += f"The document contains information about {keyword}. "
+                content = f"This is a {doc_type} filing for {company}. " + "".join(
+                    f"The document contains information about {keyword}. " for keyword in selected_keywords
+                )
                 
                 documents.append({
                     "id": f"SEC-{doc_type}-{company}-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
@@ -100,9 +158,12 @@ def fetch_financial_news(query="financial regulation compliance", days=1, count=
             "pageSize": count
         }
         
-        response = requests.get(NEWS_API_ENDPOINT, params=params)
+        response = conditional_get(NEWS_API_ENDPOINT, params)
         
-        if response.status_code == 200:
+        if response is None:
+            # Nothing new since the last poll
+            return []
+        elif response.status_code == 200:
             data = response.json()
             documents = []
             
@@ -111,7 +172,7 @@ def fetch_financial_news(query="financial regulation compliance", days=1, count=
                 jurisdiction = categorize_by_jurisdiction(article.get("content", ""))
                 
                 documents.append({
-                    "id": f"NEWS-{hash(article.get('url', ''))}",
+                    "id": f"NEWS-{stable_hash(article.get('url', ''))}",
                     "type": "NEWS_ARTICLE",
                     "title": article.get("title", ""),
                     "source": article.get("source", {}).get("name", "Unknown"),
@@ -145,15 +206,14 @@ def generate_mock_news(count=5):
         jurisdiction = "EU" if any(eu_term in topic for eu_term in ["GDPR", "MiFID", "EU"]) else "US"
         
         # Generate random content with compliance keywords
-        keywords = list(COMPLIANCE_KEYWORDS.keys())
-        selected_keywords = random.sample(keywords, k=random.randint(1, 3))
+        selected_keywords = random.sample(KEYWORD_LIST, k=random.randint(1, 3))
         
-        content = f"This is a news article about {topic} from {source}. "
-        for keyword in selected_keywords:
-            content += f"The article discusses {keyword} implications. "
+        content = f"This is a news article about {topic} from {source}. " + "".join(
+            f"The article discusses {keyword} implications. " for keyword in selected_keywords
+        )
         
         documents.append({
-            "id": f"NEWS-{hash(source + '-' + topic + '-' + datetime.now().strftime('%Y%m%d-%H%M%S'))}",
+            "id": f"NEWS-{stable_hash(source + '-' + topic + '-' + datetime.now().strftime('%Y%m%d-%H%M%S'))}",
             "type": "NEWS_ARTICLE",
             "title": f"New developments in {topic}",
             "source": source,
@@ -166,6 +226,58 @@ def generate_mock_news(count=5):
     
     return documents
 
+class BatchingSink:
+    """
+    Pipeline sink that buffers rows and analyzes them in batches
+    A batch is flushed once it holds flush_size rows or its oldest row is flush_ms old
+    """
+    def __init__(self, flush_size=16, flush_ms=500):
+        self.flush_size = flush_size
+        self.flush_ms = flush_ms
+        self.buffer = []
+        self.lock = threading.Lock()
+        self.timer = None
+    
+    def __call__(self, row):
+        with self.lock:
+            self.buffer.append(dict(row))
+            if len(self.buffer) >= self.flush_size:
+                batch = self._take_batch()
+            else:
+                batch = None
+                if self.timer is None:
+                    # Flush a partial batch once its first row has waited flush_ms
+                    self.timer = threading.Timer(self.flush_ms / 1000, self.flush)
+                    self.timer.daemon = True
+                    self.timer.start()
+        
+        if batch:
+            self._process(batch)
+    
+    def flush(self):
+        with self.lock:
+            batch = self._take_batch()
+        
+        if batch:
+            self._process(batch)
+    
+    def _take_batch(self):
+        # Must be called with the lock held
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.buffer = self.buffer, []
+        return batch
+    
+    def _process(self, batch):
+        try:
+            embeddings = generate_embeddings_batch([doc["content"] for doc in batch])
+            risk_analyses = analyze_documents_risk_batch(batch, embeddings)
+            for doc, risk_analysis, embedding in zip(batch, risk_analyses, embeddings):
+                process_document(doc, risk_analysis, embedding)
+        except Exception as e:
+            print(f"Error processing pipeline batch: {str(e)}")
+
 def setup_pathway_pipeline():
     """
     Set up the Pathway data processing pipeline
@@ -222,33 +334,33 @@ def setup_pathway_pipeline():
         )
     )
     
-    # Process documents for compliance analysis
-    analyzed_documents = all_documents.select(
-        pw.this.id, pw.this.type, pw.this.title, pw.this.source, 
-        pw.this.date, pw.this.content, pw.this.jurisdiction,
-        risk_score=pw.apply(lambda doc: analyze_document_risk(doc["id"], doc["content"])["risk_score"], pw.this),
-        keywords=pw.this.keywords
-    )
-    
     # Output connectors
     # In a production environment, these would write to persistent storage
-    # For this prototype, we'll use simple callbacks
-    
-    # Update vector index with new documents
-    analyzed_documents.sink_to(pw.io.python_callback(
-        lambda row: update_vector_index(row)
-    ))
-    
-    # Check for high-risk documents and send alerts
-    analyzed_documents.filter(
-        pw.this.risk_score >= 0.7  # High risk threshold
-    ).sink_to(pw.io.python_callback(
-        lambda row: check_and_send_alerts(row, {"risk_score": row["risk_score"], "jurisdiction": row["jurisdiction"]})
+    # For this prototype, rows are buffered into micro-batches that are scored
+    # together, then indexed and alerted on by process_document
+    all_documents.sink_to(pw.io.python_callback(
+        BatchingSink(flush_size=16, flush_ms=500)
     ))
     
     # Run the pipeline
     pw.run()
 
+def process_document(doc, risk_analysis=None, embedding=None):
+    """
+    Score, index and (if high risk) alert on a single document in one pass
+    Pass risk_analysis and embedding when they were already computed, e.g. by a batched analysis
+    """
+    if risk_analysis is None:
+        risk_analysis = analyze_document_risk(doc["id"], doc["content"])
+    
+    doc["risk_score"] = risk_analysis["risk_score"]
+    update_vector_index(doc, embedding)
+    
+    if risk_analysis["risk_score"] >= 0.7:
+        check_and_send_alerts(doc, risk_analysis)
+    
+    return risk_analysis
+
 def data_ingestion_thread():
     """
     Thread function to run the data ingestion pipeline
@@ -256,44 +368,51 @@ def data_ingestion_thread():
     global running
     
     try:
-        # Start the mock WebSocket server
-        websocket_thread = threading.Thread(target=start_mock_websocket_server)
-        websocket_thread.daemon = True
-        websocket_thread.start()
+        # Poll each source on its own cadence; sources are due immediately on start
+        poll_intervals = {"sec": SEC_POLL_INTERVAL, "news": NEWS_POLL_INTERVAL}
+        fetchers = {"sec": fetch_sec_filings, "news": fetch_financial_news}
+        next_poll = {source: 0.0 for source in poll_intervals}
         
-        # In a loop, fetch data and feed it to the Pathway pipeline
-        while running:
-            # Fetch SEC filings
-            sec_documents = fetch_sec_filings(count=random.randint(1, 3))
-            for doc in sec_documents:
-                # In a production environment, this would be fed into the Pathway input connectors
-                # For this prototype, we'll directly update the vector index
-                update_vector_index(doc)
-                risk_analysis = analyze_document_risk(doc["id"], doc["content"])
-                if risk_analysis["risk_score"] >= 0.7:
-                    check_and_send_alerts(doc, risk_analysis)
-            
-            # Fetch financial news
-            news_documents = fetch_financial_news(count=random.randint(1, 3))
-            for doc in news_documents:
-                # In a production environment, this would be fed into the Pathway input connectors
-                # For this prototype, we'll directly update the vector index
-                update_vector_index(doc)
-                risk_analysis = analyze_document_risk(doc["id"], doc["content"])
-                if risk_analysis["risk_score"] >= 0.7:
-                    check_and_send_alerts(doc, risk_analysis)
-            
-            # Wait before the next iteration
-            time.sleep(10)
+        # The sources are on different servers, so fetch the due ones in parallel
+        with ThreadPoolExecutor(max_workers=len(fetchers), thread_name_prefix="ingestion-fetch") as fetch_executor:
+            while running:
+                now = time.monotonic()
+                due_sources = [source for source, due_at in next_poll.items() if due_at <= now]
+                
+                # Fetch SEC filings and financial news
+                fetches = [
+                    fetch_executor.submit(fetchers[source], count=random.randint(1, 3))
+                    for source in due_sources
+                ]
+                new_documents = [doc for fetch in fetches for doc in fetch.result()]
+                
+                for source in due_sources:
+                    next_poll[source] = now + poll_intervals[source]
+                
+                if new_documents:
+                    # Embed each document once; the embedding feeds both the risk head and the index
+                    embeddings = generate_embeddings_batch([doc["content"] for doc in new_documents])
+                    
+                    # Analyze the whole polling cycle in batched requests rather than one call per document
+                    risk_analyses = analyze_documents_risk_batch(new_documents, embeddings)
+                    
+                    # In a production environment, these would be fed into the Pathway input connectors
+                    # For this prototype, we'll directly update the vector index
+                    for doc, risk_analysis, embedding in zip(new_documents, risk_analyses, embeddings):
+                        process_document(doc, risk_analysis, embedding)
+                
+                # Sleep until the next source is due, waking early if the pipeline is stopped
+                stop_event.wait(max(0.0, min(next_poll.values()) - time.monotonic()))
     except Exception as e:
         print(f"Exception in data_ingestion_thread: {str(e)}")
     finally:
         running = False
 
-def start_ingestion_pipeline(uploaded_file=None):
+def start_ingestion_pipeline(uploaded_file=None, phone_number=None):
     """
     Start the data ingestion pipeline
     If a file is uploaded, process it directly
+    High-risk alerts from the pipeline are sent to phone_number
     """
     if uploaded_file is not None:
         # For uploaded files, just return the content
@@ -310,8 +429,11 @@ def start_ingestion_pipeline(uploaded_file=None):
     
     global running, pipeline_thread
     
+    set_alert_phone_number(phone_number)
+    
     if not running:
         running = True
+        stop_event.clear()
         pipeline_thread = threading.Thread(target=data_ingestion_thread)
         pipeline_thread.daemon = True
         pipeline_thread.start()
@@ -325,12 +447,32 @@ def start_ingestion_pipeline(uploaded_file=None):
     else:
         return "Pipeline is already running"
 
+def set_alert_phone_number(phone_number):
+    """
+    Set the recipient for alerts raised by the pipeline, taking effect immediately if it is running
+    """
+    global alert_phone_number
+    alert_phone_number = phone_number or None
+
 def stop_ingestion_pipeline():
     """
     Stop the data ingestion pipeline
     """
     global running
     running = False
+    stop_event.set()
+    stop_mock_websocket_server()
+
+def _forget_failed_alert(alert_key, future):
+    """
+    Drop a recent alert whose SMS could not be sent so it isn't deduplicated
+    """
+    if future.exception() is None and future.result():
+        return
+    
+    with recent_alerts_lock:
+        if recent_alerts.get(alert_key) is future:
+            del recent_alerts[alert_key]
 
 def check_and_send_alerts(document, risk_analysis):
     """
@@ -341,21 +483,34 @@ def check_and_send_alerts(document, risk_analysis):
         
         # Send alerts for high-risk documents (risk score >= 0.7)
         if risk_score >= 0.7:
-            message = f"""🚨 HIGH RISK ALERT
+            # Read the recipient once, it can be changed from the dashboard at any time
+            phone_number = alert_phone_number
+            alert_key = (document.get('id'), round(risk_score, 1), phone_number)
+            with recent_alerts_lock:
+                if alert_key in recent_alerts:
+                    # Same alert was queued recently; hand back its pending result
+                    return recent_alerts[alert_key]
+                
+                message = f"""🚨 HIGH RISK ALERT
 Document: {document.get('id', 'Unknown')}
 Risk Score: {risk_score:.2%}
 Jurisdiction: {risk_analysis.get('jurisdiction', 'Unknown')}
 Categories: {', '.join(risk_analysis.get('risk_categories', []))}
 Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
+                
+                # Queue the SMS so the pipeline doesn't block on Twilio; alerts are sent in batches
+                # (queueing is non-blocking, so holding the lock here is cheap)
+                alert = queue_sms_notification(
+                    message,
+                    {"id": document.get('id'), "risk_score": risk_score},
+                    phone_number
+                )
+                recent_alerts[alert_key] = alert
             
-            # Send notification
-            notification_result = send_notification(
-                message=message,
-                document_id=document.get('id'),
-                risk_score=risk_score
-            )
-            
-            return notification_result.get("success", False)
+            # Only a sent alert suppresses repeats; a failed one may be retried right away
+            # (registered outside the lock, as the callback runs at once if the send already finished)
+            alert.add_done_callback(lambda future: _forget_failed_alert(alert_key, future))
+            return alert
         
         return True
     except Exception as e:
@@ -1,14 +1,20 @@
 import asyncio
 import websockets
-import json
+import orjson
 import random
 import time
 from datetime import datetime
 import threading
 
+# uvloop is optional; it gives the broadcast loop a faster event loop where available
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Global variables
 running = True
-connected_clients = set()
+connected_clients = {}  # WebSocket -> its outgoing message queue
 regulatory_agencies = {
     "US": ["SEC", "FINRA", "CFTC", "Federal Reserve", "OCC"],
     "EU": ["ESMA", "EBA", "ECB", "European Commission", "EIOPA"]
@@ -41,50 +47,102 @@ regulatory_topics = {
     ]
 }
 
-async def mock_websocket_handler(websocket, path):
+# Pub/sub broadcast: a single producer publishes each update once, encoded, to
+# broadcast_queue; the dispatcher copies it into every client's own queue so a
+# slow client only backs up itself
+UPDATE_INTERVAL = 60
+CLIENT_QUEUE_SIZE = 100
+WEBSOCKET_BUFFER_SIZE = 2 ** 20
+broadcast_queue = None
+stop_event = None
+server_loop = None
+
+def generate_update():
+    """
+    Generate a mock regulatory update
+    """
+    return {
+        "id": f"REG-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
+        "type": "REGULATORY_UPDATE",
+        "title": "New Regulatory Guidance",
+        "agency": random.choice(["SEC", "FINRA", "FCA", "ESMA"]),
+        "published_date": datetime.now().strftime("%Y-%m-%d"),
+        "content": "This is a mock regulatory update.",
+        "url": "https://example.com/regulatory-update",
+        "jurisdiction": random.choice(["US", "EU", "GLOBAL"]),
+        "importance": random.randint(1, 5)
+    }
+
+async def mock_websocket_handler(websocket, path=None):
     """
-    Mock WebSocket handler that sends regulatory updates
+    Mock WebSocket handler that forwards broadcast regulatory updates to its client
+    Payloads are UTF-8 JSON bytes and go out as text frames
     """
+    queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+    # Greet the new client right away instead of waiting for the next tick
+    queue.put_nowait(orjson.dumps(generate_update()))
+    connected_clients[websocket] = queue
     try:
         while True:
-            # Generate a mock regulatory update
-            update = {
-                "id": f"REG-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
-                "type": "REGULATORY_UPDATE",
-                "title": "New Regulatory Guidance",
-                "agency": random.choice(["SEC", "FINRA", "FCA", "ESMA"]),
-                "published_date": datetime.now().strftime("%Y-%m-%d"),
-                "content": "This is a mock regulatory update.",
-                "url": "https://example.com/regulatory-update",
-                "jurisdiction": random.choice(["US", "EU", "GLOBAL"]),
-                "importance": random.randint(1, 5)
-            }
-            
-            await websocket.send(json.dumps(update))
-            await asyncio.sleep(60)  # Send update every minute
+            await websocket.send(await queue.get(), text=True)
     except websockets.exceptions.ConnectionClosed:
         pass
+    finally:
+        connected_clients.pop(websocket, None)
+
+def broadcast(payload):
+    """
+    Queue an already-encoded payload for every connected client
+    A client whose queue is full drops its oldest pending update
+    """
+    for queue in list(connected_clients.values()):
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(payload)
+
+async def dispatch_updates():
+    """
+    Fan each published update out to the connected clients
+    """
+    while True:
+        broadcast(await broadcast_queue.get())
+
+async def produce_updates():
+    """
+    Publish a regulatory update every UPDATE_INTERVAL seconds
+    """
+    while True:
+        await asyncio.sleep(UPDATE_INTERVAL)
+        if connected_clients:
+            await broadcast_queue.put(orjson.dumps(generate_update()))
 
 async def start_server():
     """
     Start the WebSocket server
     """
-    global running
+    global broadcast_queue, stop_event, server_loop
+    
+    broadcast_queue = asyncio.Queue()
+    stop_event = asyncio.Event()
+    server_loop = asyncio.get_running_loop()
     
-    # Start the server
-    server = await websockets.serve(
+    # Serve until shutdown is requested; the context manager closes the server on exit.
+    # A larger write buffer lets bursts of updates coalesce, and compression is off
+    # because deflate costs more CPU than it saves on small JSON frames
+    async with websockets.serve(
         mock_websocket_handler,
         "localhost",
-        8765
-    )
-    
-    # Keep the server running
-    while running:
-        await asyncio.sleep(1)
-    
-    # Stop the server
-    server.close()
-    await server.wait_closed()
+        8765,
+        write_limit=WEBSOCKET_BUFFER_SIZE,
+        max_size=WEBSOCKET_BUFFER_SIZE,
+        compression=None
+    ):
+        tasks = [asyncio.create_task(produce_updates()), asyncio.create_task(dispatch_updates())]
+        try:
+            await stop_event.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
 
 def start_mock_websocket_server():
     """
@@ -95,8 +153,26 @@ def start_mock_websocket_server():
     running = True
     
     try:
-        start_server()
+        # Run on uvloop when installed; it is used only for this server's thread
+        # so the rest of the app keeps the default event loop
+        if uvloop is not None:
+            uvloop.run(start_server())
+        else:
+            asyncio.run(start_server())
     except Exception as e:
         print(f"Error starting mock WebSocket server: {str(e)}")
     finally:
         running = False
+
+def stop_mock_websocket_server():
+    """
+    Stop the mock WebSocket server from any thread
+    """
+    if server_loop is None or stop_event is None:
+        return
+    
+    try:
+        server_loop.call_soon_threadsafe(stop_event.set)
+    except RuntimeError:
+        # The server's loop has already shut down
+        pass
\ No newline at end of file
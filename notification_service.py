@@ -1,19 +1,33 @@
 import os
 import json
+import logging
+import asyncio
 from datetime import datetime
 import threading
 import time
 import random
+import queue
+from functools import lru_cache
+from collections import deque
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
 import streamlit as st
 
 # Use the Twilio blueprint for sending SMS
 from twilio.rest import Client
+from twilio.http.http_client import TwilioHttpClient
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Diagnostics for the SMS path; off unless the app enables DEBUG/INFO logging
+logger = logging.getLogger(__name__)
 
 # Development mode flag
 DEV_MODE = False  # Set to False to enable production mode
 
+@lru_cache(maxsize=1)
 def get_credentials():
-    """Get credentials from either environment variables or Streamlit secrets"""
+    """Get credentials from either environment variables or Streamlit secrets (read once, then cached)"""
     try:
         # Try to get from Streamlit secrets first (for production)
         if 'twilio' in st.secrets:
@@ -36,41 +50,133 @@ def get_credentials():
 # Global notification settings
 notification_settings = {
     "sms_notifications_enabled": True,  # Enable SMS by default
-    "notification_history": [],
+    "notification_history": deque(maxlen=1000),  # Most recent notifications only
     "dev_mode": DEV_MODE
 }
 
 # Notification history lock
 history_lock = threading.Lock()
 
-# Initialize Twilio credentials as None
-TWILIO_ACCOUNT_SID = None
-TWILIO_AUTH_TOKEN = None
-TWILIO_PHONE_NUMBER = None
-NOTIFICATION_PHONE_NUMBER = None  # Will be set when user enters their number in the UI
+def _record(entry):
+    """
+    Append an entry to the notification history
+    """
+    with history_lock:
+        notification_settings["notification_history"].append(entry)
+
+NOTIFICATION_PHONE_NUMBER = None  # Default recipient when no phone number is passed explicitly
+
+# Shared Twilio client, so successive sends reuse its HTTP connection pool
+_twilio_client = None
+_twilio_client_lock = threading.Lock()
+TWILIO_TIMEOUT = 10
+
+@dataclass(frozen=True, slots=True)
+class TwilioCredentials:
+    """
+    Twilio account credentials and the sender phone number
+    """
+    account_sid: str = None
+    auth_token: str = None
+    phone_number: str = None
+    
+    def is_configured(self):
+        return all([self.account_sid, self.auth_token, self.phone_number])
+
+@lru_cache(maxsize=1)
+def get_twilio_credentials():
+    """
+    Get the Twilio credentials, frozen on first use so later sends skip the secrets lookup
+    """
+    credentials = get_credentials() or {}
+    return TwilioCredentials(
+        credentials.get("account_sid"),
+        credentials.get("auth_token"),
+        credentials.get("phone_number")
+    )
 
 def initialize_twilio_credentials():
-    """Initialize Twilio credentials from environment or secrets"""
-    global TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, TWILIO_PHONE_NUMBER
-    credentials = get_credentials()
-    if credentials:
-        TWILIO_ACCOUNT_SID = credentials["account_sid"]
-        TWILIO_AUTH_TOKEN = credentials["auth_token"]
-        TWILIO_PHONE_NUMBER = credentials["phone_number"]
-        
-        # Debug info (will only show in development)
-        if DEV_MODE:
-            print(f"Twilio credentials initialized:")
-            print(f"Account SID: {'Set' if TWILIO_ACCOUNT_SID else 'Not Set'}")
-            print(f"Auth Token: {'Set' if TWILIO_AUTH_TOKEN else 'Not Set'}")
-            print(f"Phone Number: {TWILIO_PHONE_NUMBER if TWILIO_PHONE_NUMBER else 'Not Set'}")
+    """Reload Twilio credentials from environment or secrets"""
+    global _twilio_client
+    get_credentials.cache_clear()
+    get_twilio_credentials.cache_clear()
+    credentials = get_twilio_credentials()
+    
+    # Rebuild the client with the new credentials on next use
+    with _twilio_client_lock:
+        _twilio_client = None
+    
+    # Debug info (will only show in development)
+    if DEV_MODE:
+        print(f"Twilio credentials initialized:")
+        print(f"Account SID: {'Set' if credentials.account_sid else 'Not Set'}")
+        print(f"Auth Token: {'Set' if credentials.auth_token else 'Not Set'}")
+        print(f"Phone Number: {credentials.phone_number if credentials.phone_number else 'Not Set'}")
+
+def create_twilio_http_client():
+    """
+    Create a pooled HTTP client for Twilio so SMS sends reuse keep-alive connections
+    """
+    http_client = TwilioHttpClient(pool_connections=True, timeout=TWILIO_TIMEOUT)
+    # Sized for the SMS executor; Retry leaves POST alone on read errors, so only
+    # failed connects are retried and a message is never sent twice
+    http_client.session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    ))
+    return http_client
+
+def get_twilio_client():
+    """
+    Get the shared Twilio client, creating it on first use
+    """
+    global _twilio_client
+    
+    with _twilio_client_lock:
+        if _twilio_client is None:
+            credentials = get_twilio_credentials()
+            _twilio_client = Client(credentials.account_sid, credentials.auth_token, http_client=create_twilio_http_client())
+        return _twilio_client
+
+# Document details appended to alert SMS; only the field values change between sends
+SMS_DOCUMENT_TEMPLATE = "{message}\nDoc ID: {id}\nRisk: {risk_score:.2f}\nJurisdiction: {jurisdiction}"
+
+def render_sms(message, document=None):
+    """
+    Build the SMS body for a message and optional document
+    """
+    if not document:
+        return message
+    
+    return SMS_DOCUMENT_TEMPLATE.format(
+        message=message,
+        id=document.get('id', 'Unknown'),
+        risk_score=document.get('risk_score', 0),
+        jurisdiction=document.get('jurisdiction', 'Unknown')
+    )
 
-# Initialize credentials when module is loaded
-initialize_twilio_credentials()
+def send_sms_notification(message, document=None, phone_number=None):
+    """
+    Send an SMS notification using Twilio and record it in the notification history
+    The recipient defaults to NOTIFICATION_PHONE_NUMBER when phone_number is not given
+    """
+    recipient = phone_number or NOTIFICATION_PHONE_NUMBER
+    sent = _send_sms(message, document, recipient)
+    
+    _record({
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "type": "sms",
+        "message": message,
+        "recipient": recipient,
+        "document_id": document.get("id") if document else None,
+        "success": sent
+    })
+    return sent
 
-def send_sms_notification(message, document=None):
+def _send_sms(message, document, recipient):
     """
-    Send an SMS notification using Twilio
+    Deliver an SMS through Twilio (or print it in development mode)
     """
     if notification_settings["dev_mode"]:
         print("\n=== Development Mode: SMS Notification ===")
@@ -81,46 +187,108 @@ def send_sms_notification(message, document=None):
         print("==========================================\n")
         return True
         
-    # Debug logging
-    print("\n=== SMS Notification Debug ===")
-    print(f"TWILIO_ACCOUNT_SID: {'Set' if TWILIO_ACCOUNT_SID else 'Not Set'}")
-    print(f"TWILIO_AUTH_TOKEN: {'Set' if TWILIO_AUTH_TOKEN else 'Not Set'}")
-    print(f"TWILIO_PHONE_NUMBER: {TWILIO_PHONE_NUMBER if TWILIO_PHONE_NUMBER else 'Not Set'}")
-    print(f"NOTIFICATION_PHONE_NUMBER: {NOTIFICATION_PHONE_NUMBER if NOTIFICATION_PHONE_NUMBER else 'Not Set'}")
-    
-    if not all([TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, TWILIO_PHONE_NUMBER, NOTIFICATION_PHONE_NUMBER]):
+    credentials = get_twilio_credentials()
+    
+    # Debug logging; arguments are only formatted when DEBUG is enabled
+    logger.debug(
+        "SMS notification: account SID set=%s, auth token set=%s, sender=%s, recipient=%s",
+        bool(credentials.account_sid),
+        bool(credentials.auth_token),
+        credentials.phone_number or "Not Set",
+        recipient or "Not Set"
+    )
+    
+    if not (credentials.is_configured() and recipient):
         print("❌ Twilio credentials or phone number not fully configured")
         return False
     
     try:
-        # Initialize the Twilio client
-        client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+        # Reuse the shared Twilio client
+        client = get_twilio_client()
         
         # Prepare the message
-        sms_message = message
-        if document:
-            sms_message += f"\nDoc ID: {document.get('id', 'Unknown')}"
-            sms_message += f"\nRisk: {document.get('risk_score', 0):.2f}"
-            sms_message += f"\nJurisdiction: {document.get('jurisdiction', 'Unknown')}"
+        sms_message = render_sms(message, document)
         
-        print(f"Sending SMS to: {NOTIFICATION_PHONE_NUMBER}")
-        print(f"Message: {sms_message}")
+        logger.debug("Sending SMS to %s: %s", recipient, sms_message)
         
         # Send the SMS
         twilio_message = client.messages.create(
             body=sms_message,
-            from_=TWILIO_PHONE_NUMBER,
-            to=NOTIFICATION_PHONE_NUMBER
+            from_=credentials.phone_number,
+            to=recipient
         )
         
-        print(f"✅ SMS notification sent with SID: {twilio_message.sid}")
+        logger.info("SMS notification sent with SID: %s", twilio_message.sid)
         return True
     
     except Exception as e:
         print(f"❌ Error sending SMS notification: {str(e)}")
         return False
 
-def send_notification(message, document_id=None, risk_score=None):
+# Bulk sending: queued alerts are flushed every SMS_FLUSH_INTERVAL seconds or
+# once SMS_BATCH_SIZE are waiting, and each batch is sent concurrently
+SMS_BATCH_SIZE = 50
+SMS_FLUSH_INTERVAL = 0.2
+sms_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="sms")
+sms_queue = queue.Queue()
+sms_worker = None
+sms_worker_lock = threading.Lock()
+
+def send_sms_bulk(items):
+    """
+    Send several SMS notifications concurrently
+    items are (message, document, phone_number) tuples; returns whether each was sent, in order
+    """
+    futures = [sms_executor.submit(send_sms_notification, *item) for item in items]
+    return [future.result() for future in futures]
+
+def sms_worker_loop():
+    """
+    Background worker that drains the SMS queue in batches
+    """
+    while True:
+        batch = [sms_queue.get()]
+        deadline = time.monotonic() + SMS_FLUSH_INTERVAL
+        while len(batch) < SMS_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(sms_queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        
+        try:
+            results = send_sms_bulk([item[:3] for item in batch])
+            for item, sent in zip(batch, results):
+                item[3].set_result(sent)
+        except Exception as e:
+            print(f"❌ Error sending SMS batch: {str(e)}")
+            for item in batch:
+                if not item[3].done():
+                    item[3].set_exception(e)
+
+def queue_sms_notification(message, document=None, phone_number=None):
+    """
+    Queue an SMS notification for the background sender instead of blocking on Twilio
+    Returns a Future that resolves to whether the SMS was sent
+    """
+    global sms_worker
+    
+    future = Future()
+    if not notification_settings["sms_notifications_enabled"]:
+        future.set_result(False)
+        return future
+    
+    with sms_worker_lock:
+        if sms_worker is None:
+            sms_worker = threading.Thread(target=sms_worker_loop, daemon=True)
+            sms_worker.start()
+    
+    sms_queue.put((message, document, phone_number, future))
+    return future
+
+def send_notification(message, document_id=None, risk_score=None, phone_number=None):
     """
     Send a notification
     """
@@ -137,7 +305,7 @@ def send_notification(message, document_id=None, risk_score=None):
         print("\n=== Development Mode: Sending Notifications ===")
         
         # Send SMS notification
-        if send_sms_notification(message, document):
+        if send_sms_notification(message, document, phone_number):
             print("Successfully sent SMS notification in development mode")
             print("============================================\n")
             return {
@@ -151,7 +319,7 @@ def send_notification(message, document_id=None, risk_score=None):
     # Send SMS notification
     if notification_settings["sms_notifications_enabled"]:
         try:
-            if send_sms_notification(message, document):
+            if send_sms_notification(message, document, phone_number):
                 return {
                     "success": True,
                     "notifications_sent": 1,
@@ -180,9 +348,22 @@ def send_notification(message, document_id=None, risk_score=None):
         "dev_mode": False
     }
 
+async def send_sms_notification_async(message, document=None, phone_number=None):
+    """
+    Send an SMS notification from async code without blocking the event loop
+    The Twilio SDK is synchronous, so the send runs in a worker thread
+    """
+    return await asyncio.to_thread(send_sms_notification, message, document, phone_number)
+
+async def send_notification_async(message, document_id=None, risk_score=None, phone_number=None):
+    """
+    Send a notification from async code without blocking the event loop
+    """
+    return await asyncio.to_thread(send_notification, message, document_id, risk_score, phone_number)
+
 def get_notification_history():
     """
     Get the notification history
     """
     with history_lock:
-        return notification_settings["notification_history"]
+        return list(notification_settings["notification_history"])
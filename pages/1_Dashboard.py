@@ -0,0 +1,729 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import time
+import json
+import asyncio
+import random
+import hashlib
+from datetime import datetime, date
+from streamlit_extras.colored_header import colored_header
+from openai import AsyncOpenAI, RateLimitError
+
+from data_ingestion import start_ingestion_pipeline, set_alert_phone_number
+from vector_store import query_hybrid_index, get_latest_documents, get_document, get_last_update_time, get_document_risk_scores
+from compliance_analyzer import analyze_document_risk, categorize_by_jurisdiction
+from notification_service import send_notification
+from redis_cache import get_cached_result, cache_result
+from utils import format_datetime, format_risk_scores, get_openai_client, get_risk_colors, load_css
+from compliance_keywords import COMPLIANCE_KEYWORDS, RISK_LEVELS
+
+# Initialize OpenAI client (shared across reruns and sessions)
+client = get_openai_client()
+
+# Page configuration
+st.set_page_config(
+    page_title="Financial Compliance Copilot",
+    page_icon="📊",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Card color for each risk bucket (low -> critical), and for documents without a score
+RISK_COLORS = np.array(["#4CAF50", "#FFC107", "#FF9800", "#F44336"])
+MISSING_RISK_COLOR = "#9E9E9E"
+
+# HTML template for a document card in the Document Analysis tab
+DOCUMENT_CARD_TEMPLATE = """
+<div class="document-card" style="border-left: 5px solid {color};">
+    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">
+        <div>
+            <span style="font-weight: bold; color: #212121;">{id}</span>
+            <span style="color: #757575; font-size: 0.9rem; margin-left: 10px;">{date}</span>
+        </div>
+        <div style="background: {color}; color: white; padding: 3px 8px; border-radius: 20px; font-size: 0.8rem;">
+            Risk: {risk_text}
+        </div>
+    </div>
+    <p style="margin: 5px 0; font-weight: bold; color: #212121;">{title}</p>
+    <p style="margin: 5px 0; color: #212121;"><strong>Source:</strong> {source}</p>
+    <p style="margin: 5px 0; color: #212121;"><strong>Jurisdiction:</strong> {jurisdiction}</p>
+    <p style="margin: 5px 0; color: #212121;"><strong>Keywords:</strong> {keywords_text}</p>
+    <p style="margin: 5px 0; color: #212121;"><strong>Summary:</strong> {summary}</p>
+</div>
+"""
+
+# HTML template for a collapsible Q&A source, so all sources render in one markdown call
+SOURCE_TEMPLATE = """
+<details class="metric-card" style="padding: 10px; margin-bottom: 10px;">
+    <summary><strong>Source {number}: {title}</strong></summary>
+    <p><strong>Document ID:</strong> {id}</p>
+    <p><strong>Relevance Score:</strong> {score:.2f}</p>
+    <p><strong>Date:</strong> {date}</p>
+    <p><strong>Excerpt:</strong> {excerpt}</p>
+</details>
+"""
+
+# Number of document cards rendered per page in the Document Analysis tab
+DOCUMENTS_PAGE_SIZE = 25
+
+# Cached document lookup so identical filters don't re-query the index on every rerun
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_latest_documents(jurisdiction, min_risk, search_query, page=1):
+    return get_latest_documents(
+        jurisdiction=jurisdiction,
+        min_risk=min_risk,
+        search_query=search_query,
+        limit=DOCUMENTS_PAGE_SIZE,
+        offset=(page - 1) * DOCUMENTS_PAGE_SIZE,
+        include_content=False
+    )
+
+# Shown until the pipeline has indexed documents
+SAMPLE_RISK_DISTRIBUTION = (("US", "EU", "UK", "APAC", "Other"), (42, 35, 18, 12, 8))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_risk_distribution(last_update):
+    """
+    Count indexed documents per jurisdiction
+    last_update is the index update time, so counts are recomputed only when the index changes
+    """
+    df = pd.DataFrame(get_document_risk_scores(), columns=["jurisdiction", "risk_score"])
+    if df.empty:
+        return SAMPLE_RISK_DISTRIBUTION
+    
+    risk_counts = df.groupby("jurisdiction")["risk_score"].count()
+    return tuple(risk_counts.index), tuple(risk_counts.tolist())
+
+# Build each distinct figure once and reuse it across reruns; the counts change as documents
+# are ingested, so only the most recent figures are kept
+@st.cache_data(max_entries=4, show_spinner=False)
+def build_risk_distribution_chart(jurisdictions, risk_counts):
+    colors = ['#F44336', '#FF9800', '#FFC107', '#4CAF50', '#2196F3']
+    
+    fig = go.Figure(data=[go.Pie(
+        labels=jurisdictions,
+        values=risk_counts,
+        hole=.4,
+        marker_colors=colors
+    )])
+    
+    fig.update_layout(
+        margin=dict(t=0, b=0, l=0, r=0),
+        height=300,
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.2,
+            xanchor="center",
+            x=0.5
+        )
+    )
+    
+    return fig
+
+# Rerun only the decorated panel on interaction where supported (Streamlit 1.33+)
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+@fragment
+def render_document_analysis(document_ids):
+    """
+    Document selector and on-demand risk analysis panel
+    """
+    analyze_doc_id = st.selectbox(
+        "Select a document to analyze",
+        document_ids,
+        key="analyze_doc_id"
+    )
+    
+    if st.button("Analyze Document", key="analyze_document"):
+        with st.spinner("Analyzing document..."):
+            # Content is left out of the listing, so load it only when analysis is requested
+            st.session_state.document_analysis = (
+                analyze_doc_id,
+                analyze_document_risk(analyze_doc_id, get_document(analyze_doc_id)['content'])
+            )
+    
+    # Keep showing the last result for the selected document across reruns
+    analyzed_doc_id, analysis_result = st.session_state.get("document_analysis", (None, None))
+    if analyzed_doc_id == analyze_doc_id:
+        st.json(analysis_result)
+
+QA_SYSTEM_PROMPT = """You are a financial compliance expert assistant. 
+Your task is to provide accurate, clear, and concise answers to questions about financial regulations and compliance.
+Base your answers on the provided context documents, and clearly indicate if you're unsure about any information.
+Format your responses with clear sections and bullet points where appropriate."""
+
+# Concurrency and retry limits for parallel Q&A requests
+QA_MAX_CONCURRENCY = 20
+QA_MAX_ATTEMPTS = 5
+
+# Number of source documents per answer, and how long answers stay cached
+QA_TOP_K = 3
+QA_CACHE_TTL = 3600
+
+def search_jurisdiction_context(question, jurisdiction):
+    """
+    Query the vector store for documents relevant to a question in one jurisdiction
+    """
+    return query_hybrid_index(
+        query=question,
+        jurisdiction=jurisdiction if jurisdiction != "GLOBAL" else None,
+        top_k=QA_TOP_K
+    )
+
+def _qa_cache_key(question, jurisdiction):
+    """
+    Build the cache key for a question, normalized so trivial variations share an entry
+    """
+    normalized_question = " ".join(question.lower().split())
+    digest = hashlib.sha256(f"{normalized_question}|{jurisdiction}|{QA_TOP_K}".encode()).hexdigest()
+    return f"qa:{digest}"
+
+def get_cached_answer(question, jurisdiction):
+    """
+    Get a previously generated answer and its sources, or None
+    """
+    cached_answer = get_cached_result(_qa_cache_key(question, jurisdiction))
+    if cached_answer:
+        return json.loads(cached_answer)
+    return None
+
+def cache_answer(question, jurisdiction, answer, sources):
+    """
+    Cache a generated answer together with the sources it was based on
+    """
+    cache_result(
+        _qa_cache_key(question, jurisdiction),
+        json.dumps({"answer": answer, "sources": sources}),
+        ttl=QA_CACHE_TTL
+    )
+
+def build_qa_messages(question, search_results):
+    """
+    Build the chat messages for answering a question from retrieved documents
+    """
+    # Prepare context for OpenAI
+    context = "\n\n".join([
+        f"Document {i+1}:\n{result['excerpt']}"
+        for i, result in enumerate(search_results)
+    ])
+    
+    return [
+        {
+            "role": "system",
+            "content": QA_SYSTEM_PROMPT
+        },
+        {
+            "role": "user",
+            "content": f"""Question: {question}\n\nContext:\n{context}\n\nPlease provide a comprehensive answer based on the context provided."""
+        }
+    ]
+
+async def _answer_for_jurisdiction(aclient, semaphore, question, jurisdiction, placeholder=None):
+    """
+    Retrieve context for a single jurisdiction and generate an answer
+    The answer is streamed into placeholder (an st.empty slot) as it is generated
+    """
+    cached_answer = get_cached_answer(question, jurisdiction)
+    if cached_answer:
+        if placeholder is not None:
+            placeholder.markdown(cached_answer["answer"])
+        return {
+            "jurisdiction": jurisdiction,
+            "answer": cached_answer["answer"],
+            "sources": cached_answer["sources"]
+        }
+    
+    # The hybrid index is synchronous, so run it off the event loop
+    search_results = await asyncio.to_thread(search_jurisdiction_context, question, jurisdiction)
+    
+    messages = build_qa_messages(question, search_results)
+    
+    for attempt in range(QA_MAX_ATTEMPTS):
+        answer = ""
+        try:
+            async with semaphore:
+                stream = await aclient.chat.completions.create(
+                    model="gpt-4",
+                    messages=messages,
+                    max_tokens=1000,
+                    stream=True
+                )
+                async for chunk in stream:
+                    if chunk.choices:
+                        answer += chunk.choices[0].delta.content or ""
+                        if placeholder is not None:
+                            placeholder.markdown(answer)
+            break
+        except RateLimitError:
+            if attempt == QA_MAX_ATTEMPTS - 1:
+                raise
+            # Back off exponentially with jitter, outside the semaphore so other calls can proceed
+            await asyncio.sleep(2 ** attempt + random.random())
+    
+    cache_answer(question, jurisdiction, answer, search_results)
+    
+    return {
+        "jurisdiction": jurisdiction,
+        "answer": answer,
+        "sources": search_results
+    }
+
+async def answer_question_async(question, jurisdictions, placeholders=None):
+    """
+    Answer a question for several jurisdictions concurrently
+    placeholders optionally maps each jurisdiction to the slot its answer streams into
+    """
+    placeholders = placeholders or {}
+    
+    # Bound the number of in-flight OpenAI requests
+    semaphore = asyncio.Semaphore(QA_MAX_CONCURRENCY)
+    
+    # The async client is tied to this event loop, so open and close it per run
+    async with AsyncOpenAI(api_key=client.api_key) as aclient:
+        return await asyncio.gather(*[
+            _answer_for_jurisdiction(aclient, semaphore, question, jurisdiction, placeholders.get(jurisdiction))
+            for jurisdiction in jurisdictions
+        ])
+
+def stream_answer(question, search_results):
+    """
+    Stream the answer text for a question as the completion is generated
+    """
+    stream = client.chat.completions.create(
+        model="gpt-4",
+        messages=build_qa_messages(question, search_results),
+        max_tokens=1000,
+        stream=True
+    )
+    for chunk in stream:
+        if chunk.choices:
+            yield chunk.choices[0].delta.content or ""
+
+def render_answer_header(title):
+    """
+    Render a section header above a Q&A answer
+    """
+    st.markdown(f"""
+    <div class="dashboard-header" style="background: linear-gradient(to right, #00BCD4, #00ACC1); margin: 20px 0;">
+        <div class="dashboard-header-content">
+            <h3 style="color: #00BCD4; margin-bottom: 10px;">{title}</h3>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+def render_answer_sources(search_results):
+    """
+    Render the source documents used to answer a question
+    """
+    sources_html = "".join(
+        SOURCE_TEMPLATE.format(number=i + 1, **result)
+        for i, result in enumerate(search_results)
+    )
+    
+    st.markdown(f"""
+    <div class="dashboard-header" style="margin: 20px 0;">
+        <div class="dashboard-header-content">
+            <h3 style="color: #00BCD4; margin-bottom: 10px;">Sources</h3>
+        </div>
+    </div>
+    {sources_html}
+    """, unsafe_allow_html=True)
+
+# Initialize session state
+if 'risk_threshold' not in st.session_state:
+    st.session_state.risk_threshold = 0.7
+if 'selected_jurisdiction' not in st.session_state:
+    st.session_state.selected_jurisdiction = "All"
+if 'pipeline_running' not in st.session_state:
+    st.session_state.pipeline_running = False
+
+# Widget defaults are computed once per session; the widgets read them through their keys
+if 'date_range' not in st.session_state:
+    st.session_state.date_range = (date.today(), date.today())
+if 'phone_number' not in st.session_state:
+    st.session_state.phone_number = ""
+if 'search_query' not in st.session_state:
+    st.session_state.search_query = ""
+if 'min_risk' not in st.session_state:
+    st.session_state.min_risk = "Low"
+
+# DASHBOARD PAGE
+# Custom styling for dashboard
+st.markdown(f"<style>{load_css('dashboard.css')}</style>", unsafe_allow_html=True)
+
+# Sidebar for controls
+with st.sidebar:
+    st.markdown("""
+    <div style="text-align: center; padding-bottom: 1rem;">
+        <h2 style="color: #1E88E5;">Control Panel</h2>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Jurisdiction filter
+    st.subheader("Jurisdiction Filter")
+    selected_jurisdiction = st.selectbox(
+        "Select Jurisdiction",
+        ["All", "US", "EU", "INDIA", "ASIA", "GLOBAL"],
+        index=0,
+        key="jurisdiction_select"
+    )
+    st.session_state.selected_jurisdiction = selected_jurisdiction
+    
+    # Risk threshold slider
+    st.subheader("Risk Threshold")
+    risk_threshold = st.slider(
+        "Set Risk Threshold",
+        min_value=0.0,
+        max_value=1.0,
+        value=st.session_state.risk_threshold,
+        step=0.1,
+        format="%.1f",
+        key="risk_slider"
+    )
+    st.session_state.risk_threshold = risk_threshold
+    
+    # Date range filter
+    st.subheader("Date Range")
+    date_range = st.date_input(
+        "Select Date Range",
+        key="date_range"
+    )
+    
+    # Pipeline control
+    st.subheader("Data Pipeline Control")
+    pipeline_col1, pipeline_col2 = st.columns(2)
+    
+    with pipeline_col1:
+        if st.button("Start Pipeline", key="start_pipeline", use_container_width=True):
+            # Start the data ingestion pipeline
+            start_ingestion_pipeline(phone_number=st.session_state.get("phone_number") or None)
+            st.session_state.pipeline_running = True
+    
+    with pipeline_col2:
+        if st.button("Stop Pipeline", key="stop_pipeline", use_container_width=True):
+            # In a real application, this would stop the pipeline
+            st.session_state.pipeline_running = False
+    
+    # Display pipeline status
+    st.markdown(
+        f"""
+        <div style="background: {'#4CAF50' if st.session_state.pipeline_running else '#F44336'}; 
+            color: white; padding: 0.5rem; border-radius: 5px; text-align: center; margin-top: 0.5rem;">
+            {'Running' if st.session_state.pipeline_running else 'Stopped'}
+        </div>
+        """, 
+        unsafe_allow_html=True
+    )
+    
+    # Notification settings
+    st.subheader("Notification Settings")
+    
+    phone_number = st.text_input(
+        "Phone Number", 
+        placeholder="+1234567890",
+        help="Enter your phone number in E.164 format (e.g., +1234567890)",
+        key="phone_number",
+        # A running pipeline sends its alerts to the updated number right away
+        on_change=lambda: set_alert_phone_number(st.session_state.phone_number)
+    )
+    if phone_number:
+        st.success(f"✅ Phone number {phone_number} configured for notifications")
+    
+    # Manual notification test
+    st.subheader("Send Test Alert")
+    manual_notification = st.text_area("Notification Message", placeholder="Enter alert message here...", key="manual_notification")
+    if st.button("Send Alert", key="send_alert"):
+        if manual_notification:
+            if not phone_number:
+                st.error("❌ Please enter a phone number to receive notifications")
+            else:
+                # Create a test document for the notification
+                test_doc = {
+                    "id": f"TEST-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
+                    "risk_score": 0.8,
+                    "jurisdiction": selected_jurisdiction if selected_jurisdiction != "All" else "GLOBAL",
+                    "source": "Test Alert",
+                    "content": manual_notification
+                }
+                
+                # Send notification with test document
+                notification_result = send_notification(manual_notification, test_doc["id"], test_doc["risk_score"], phone_number=phone_number)
+                if notification_result["success"]:
+                    if notification_result.get("dev_mode", False):
+                        st.success(f"✅ Development Mode: Test notification sent successfully! ({notification_result['notifications_sent']} notifications sent)\nCheck your terminal/console for the notification logs.")
+                    else:
+                        st.success(f"✅ Test notification sent successfully! ({notification_result['notifications_sent']} notifications sent)")
+                else:
+                    error_msg = "\n".join(notification_result["errors"])
+                    st.error(f"❌ Failed to send notifications:\n{error_msg}")
+        else:
+            st.warning("⚠️ Please enter a notification message.")
+
+# Main dashboard area
+colored_header(
+    label="Financial Compliance Copilot",
+    description="Real-time compliance monitoring for financial institutions",
+    color_name="blue-70"
+)
+
+# Create tabs
+tabs = st.tabs(["Dashboard", "Document Analysis", "Q&A"])
+
+# Tab 1: Dashboard
+with tabs[0]:
+    st.markdown("""
+    <div class="dashboard-header">
+        <div class="dashboard-header-content">
+            <h2 style="color: #1E88E5; margin-bottom: 5px;">Real-Time Compliance Dashboard</h2>
+            <p style="color: #757575; margin-top: 0;">Monitor compliance risks across your organization</p>
+        </div>
+    </div>
+    <div class="tab-content">
+    """, unsafe_allow_html=True)
+    
+    # Dashboard metrics
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #F44336; font-size: 1rem; margin: 0;">High Risk Documents</h3>
+            <p style="font-size: 2.5rem; font-weight: bold; margin: 10px 0; color: #F44336;">12</p>
+            <p style="color: #757575; font-size: 0.8rem; margin: 0;">+3 in the last 24 hours</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #FFC107; font-size: 1rem; margin: 0;">Medium Risk Documents</h3>
+            <p style="font-size: 2.5rem; font-weight: bold; margin: 10px 0; color: #FFC107;">28</p>
+            <p style="color: #757575; font-size: 0.8rem; margin: 0;">+5 in the last 24 hours</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #4CAF50; font-size: 1rem; margin: 0;">Compliant Documents</h3>
+            <p style="font-size: 2.5rem; font-weight: bold; margin: 10px 0; color: #4CAF50;">143</p>
+            <p style="color: #757575; font-size: 0.8rem; margin: 0;">+18 in the last 24 hours</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Risk distribution chart
+    st.markdown("""
+    <div class="metric-card" style="margin-top: 20px;">
+        <h3 style="color: #1E88E5; font-size: 1.2rem; margin-bottom: 15px;">Risk Distribution by Jurisdiction</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.plotly_chart(build_risk_distribution_chart(*get_risk_distribution(get_last_update_time())), use_container_width=True)
+    st.markdown("</div>", unsafe_allow_html=True) # Close tab-content div
+
+# Tab 2: Document Analysis
+with tabs[1]:
+    st.markdown("""
+    <div class="dashboard-header" style="background: linear-gradient(to right, #5E35B1, #7B1FA2);">
+        <div class="dashboard-header-content">
+            <h2 style="color: #5E35B1; margin-bottom: 5px;">Document Analysis</h2>
+            <p style="color: #757575; margin-top: 0;">Search and analyze compliance documents from multiple sources</p>
+        </div>
+    </div>
+    <div class="tab-content">
+    """, unsafe_allow_html=True)
+    
+    # Search and filter
+    st.markdown("""
+    <div class="metric-card" style="margin-bottom: 20px;">
+        <h3 style="color: #5E35B1; margin-bottom: 15px; font-size: 1.2rem;">Search & Filter</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Filters are submitted together so typing or sliding doesn't trigger a query per change
+    with st.form("document_filter_form"):
+        search_col, filter_col = st.columns([2, 1])
+        
+        with search_col:
+            search_query = st.text_input("Search Documents", placeholder="Enter keywords or document ID", key="search_query")
+        
+        with filter_col:
+            min_risk = st.select_slider(
+                "Minimum Risk Level",
+                options=["Low", "Medium", "High", "Critical"],
+                key="min_risk"
+            )
+        
+        st.form_submit_button("Apply Filters")
+    
+    # Recent documents
+    st.markdown("""
+    <div class="metric-card" style="margin-bottom: 20px;">
+        <h3 style="color: #5E35B1; margin-bottom: 15px; font-size: 1.2rem;">Recent Documents</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    documents_page = st.number_input("Page", min_value=1, value=1, step=1, key="documents_page")
+    
+    # Get documents from vector store (the form already debounces filter changes)
+    documents = _cached_latest_documents(
+        selected_jurisdiction if selected_jurisdiction != "All" else None,
+        min_risk,
+        search_query if search_query else None,
+        documents_page
+    )
+    
+    if documents:
+        # Bucket and format all risk scores for the cards in single vectorized calls
+        risk_scores = np.fromiter((doc["risk_score"] for doc in documents), dtype=float, count=len(documents))
+        risk_colors = get_risk_colors(risk_scores, RISK_COLORS, missing=MISSING_RISK_COLOR)
+        risk_texts = format_risk_scores(risk_scores)
+        
+        # Render all cards as a single markdown element instead of one element per document
+        cards_html = "".join(
+            DOCUMENT_CARD_TEMPLATE.format(
+                color=risk_color, risk_text=risk_text, keywords_text=", ".join(doc["keywords"]), **doc
+            )
+            for doc, risk_color, risk_text in zip(documents, risk_colors, risk_texts)
+        )
+        st.markdown(cards_html, unsafe_allow_html=True)
+        
+        # A single selector and button replace the per-card Analyze buttons
+        render_document_analysis([doc['id'] for doc in documents])
+    else:
+        st.info("No documents matching the current filters.")
+    
+    # Live document updates
+    st.markdown("""
+    <div class="metric-card" style="margin: 20px 0;">
+        <h3 style="color: #00BCD4; margin-bottom: 15px; font-size: 1.2rem;">Live Document Updates</h3>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    doc_stream = st.empty()
+    
+    if st.session_state.pipeline_running:
+        with doc_stream.container():
+            for i in range(3):
+                risk_score = 0.3 + i*0.2
+                risk_color = "#F44336" if risk_score >= 0.8 else "#FF9800" if risk_score >= 0.6 else "#FFC107" if risk_score >= 0.4 else "#4CAF50"
+                
+                st.markdown(f"""
+                <div style="background: rgba(255, 255, 255, 0.8); border-radius: 8px; padding: 12px; margin-bottom: 10px; 
+                     border-left: 4px solid {risk_color}; animation: fadeIn 0.5s ease-in-out;">
+                    <div style="display: flex; justify-content: space-between;">
+                        <strong>New Document Detected:</strong> SEC-{1000+i}-{datetime.now().strftime('%H%M%S')}
+                        <span style="color: #757575;">{datetime.now().strftime('%H:%M:%S')}</span>
+                    </div>
+                    <div style="margin-top: 5px;">
+                        <span style="background: {risk_color}; color: white; padding: 2px 6px; border-radius: 20px; font-size: 0.8rem;">
+                            Risk Score: {risk_score:.2f}
+                        </span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+    else:
+        st.markdown("""
+        <div style="text-align: center; padding: 30px; color: #757575; background: rgba(236, 239, 241, 0.5); border-radius: 8px;">
+            <p>Start real-time monitoring to see live document updates</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("</div>", unsafe_allow_html=True) # Close tab-content div
+
+# Tab 3: Q&A
+with tabs[2]:
+    st.markdown("""
+    <div class="dashboard-header" style="background: linear-gradient(to right, #00BCD4, #00ACC1);">
+        <div class="dashboard-header-content">
+            <h2 style="color: #00BCD4; margin-bottom: 5px;">Compliance Q&A</h2>
+            <p style="color: #757575; margin-top: 0;">Get instant answers to your compliance questions</p>
+        </div>
+    </div>
+    <div class="tab-content">
+    """, unsafe_allow_html=True)
+    
+    # Check if OpenAI is properly configured
+    if not client:
+        st.error("❌ OpenAI integration is not properly configured. Please check your API key.")
+    else:
+        # Q&A interface
+        st.markdown("""
+        <div class="metric-card" style="margin-bottom: 30px;">
+            <p style="color: #00BCD4; font-size: 1.1rem; margin-bottom: 15px;">
+                <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" width="24" height="24" fill="#00BCD4" style="vertical-align: middle; margin-right: 8px;">
+                    <path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm1 17h-2v-2h2v2zm2.07-7.75l-.9.92c-.5.51-.86.97-1.04 1.69-.08.32-.13.68-.13 1.14h-2v-.5c0-.46.08-.9.22-1.31.2-.58.53-1.1.95-1.52l1.24-1.26c.46-.44.68-1.1.55-1.8-.13-.72-.69-1.33-1.39-1.53-1.11-.31-2.14.32-2.47 1.27-.12.35-.43.58-.79.58h-.13c-.55-.06-.98-.57-.93-1.12.12-1.54 1.33-2.82 2.89-3.14 1.66-.35 3.29.54 3.93 2.2.58 1.5-.14 2.99-1.1 3.89z"></path>
+                </svg>
+                Ask any question about financial regulations and compliance
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Q&A input
+        user_question = st.text_input(
+            "Ask a compliance question",
+            placeholder="Example: What are the latest SEC regulations on ESG reporting?",
+            key="qa_input"
+        )
+        
+        # Jurisdiction filter
+        st.markdown("<p style='color: #757575; margin-bottom: 5px;'>Jurisdiction Context</p>", unsafe_allow_html=True)
+        
+        qa_jurisdictions = st.multiselect(
+            "Jurisdiction Context",
+            options=["US", "EU", "INDIA", "ASIA", "GLOBAL"],
+            default=["US"],
+            label_visibility="collapsed"
+        )
+        
+        if user_question and not qa_jurisdictions:
+            st.warning("⚠️ Please select at least one jurisdiction.")
+        elif user_question:
+            try:
+                if len(qa_jurisdictions) == 1:
+                    qa_jurisdiction = qa_jurisdictions[0]
+                    cached_answer = get_cached_answer(user_question, qa_jurisdiction)
+                    
+                    if cached_answer:
+                        search_results = cached_answer["sources"]
+                        render_answer_header("Answer")
+                        st.markdown(cached_answer["answer"])
+                    else:
+                        with st.spinner("Searching for relevant information..."):
+                            search_results = search_jurisdiction_context(user_question, qa_jurisdiction)
+                        
+                        # Stream the answer so it starts rendering at the first token
+                        render_answer_header("Answer")
+                        answer = st.write_stream(stream_answer(user_question, search_results))
+                        cache_answer(user_question, qa_jurisdiction, answer, search_results)
+                    
+                    render_answer_sources(search_results)
+                else:
+                    # Give each jurisdiction its own section so every answer streams in as it is generated
+                    answer_slots = {}
+                    for qa_jurisdiction in qa_jurisdictions:
+                        render_answer_header(f"Answer ({qa_jurisdiction})")
+                        answer_slots[qa_jurisdiction] = (st.empty(), st.container())
+                    
+                    with st.spinner("Searching for relevant information..."):
+                        # Retrieve and answer for every selected jurisdiction concurrently
+                        qa_results = asyncio.run(answer_question_async(
+                            user_question,
+                            qa_jurisdictions,
+                            {qa_jurisdiction: slots[0] for qa_jurisdiction, slots in answer_slots.items()}
+                        ))
+                    
+                    for qa_result in qa_results:
+                        with answer_slots[qa_result['jurisdiction']][1]:
+                            render_answer_sources(qa_result['sources'])
+            
+            except Exception as e:
+                st.error(f"❌ Error generating answer: {str(e)}")
+                st.info("Please make sure your OpenAI API key is properly configured and has sufficient credits.")
+    
+    st.markdown("</div>", unsafe_allow_html=True)
\ No newline at end of file
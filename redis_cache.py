@@ -2,6 +2,8 @@ import os
 import redis
 import json
 import time
+import threading
+from cachetools import TLRUCache
 
 # Redis connection details
 REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
@@ -25,7 +27,8 @@ def get_redis_client():
                 port=REDIS_PORT,
                 password=REDIS_PASSWORD,
                 db=REDIS_DB,
-                decode_responses=True,
+                # Values are stored as bytes; callers decode them (json/orjson accept bytes)
+                decode_responses=False,
                 socket_timeout=5,
                 socket_connect_timeout=5
             )
@@ -69,32 +72,102 @@ def cache_result(key, value, ttl=300):
         print(f"Error caching result: {str(e)}")
         return False
 
+def get_cached_many(keys, default=None):
+    """
+    Get several cached results from Redis in a single round-trip
+    Returns a list in the same order as keys
+    """
+    if not keys:
+        return []
+    
+    client = get_redis_client()
+    
+    try:
+        # One MGET command rather than a pipeline of GETs
+        return [result if result is not None else default for result in client.mget(keys)]
+    except Exception as e:
+        print(f"Error getting cached results: {str(e)}")
+        return [default] * len(keys)
+
+def cache_many(items, ttl=300):
+    """
+    Cache several results in Redis with TTL in a single round-trip
+    items maps keys to values
+    """
+    client = get_redis_client()
+    
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(key, value, ex=ttl)
+        pipe.execute()
+        return True
+    except Exception as e:
+        print(f"Error caching results: {str(e)}")
+        return False
+
 class MockRedisClient:
     """
     Mock Redis client for when Redis is not available
+    Entries live in a bounded LRU with per-key expiry, guarded by a lock for the app's background threads
     """
+    MAX_ENTRIES = 100_000
+    
     def __init__(self):
-        self.cache = {}
-        self.expiry = {}
+        # Values are stored as (value, ttl) so each key can carry its own expiry; ttl None never expires
+        self.cache = TLRUCache(maxsize=self.MAX_ENTRIES, ttu=self._expires_at, timer=time.monotonic)
+        self.lock = threading.RLock()
+    
+    @staticmethod
+    def _expires_at(key, entry, now):
+        return now + entry[1] if entry[1] is not None else float("inf")
     
     def ping(self):
         return True
     
     def get(self, key):
-        # Check if key exists and has not expired
-        if key in self.cache and (key not in self.expiry or self.expiry[key] > time.time()):
-            return self.cache[key]
-        return None
+        with self.lock:
+            entry = self.cache.get(key)
+        return entry[0] if entry is not None else None
+    
+    def mget(self, keys):
+        with self.lock:
+            entries = [self.cache.get(key) for key in keys]
+        return [entry[0] if entry is not None else None for entry in entries]
     
     def set(self, key, value, ex=None):
-        self.cache[key] = value
-        if ex is not None:
-            self.expiry[key] = time.time() + ex
+        with self.lock:
+            self.cache[key] = (value, ex)
         return True
     
     def delete(self, key):
-        if key in self.cache:
-            del self.cache[key]
-        if key in self.expiry:
-            del self.expiry[key]
+        with self.lock:
+            self.cache.pop(key, None)
         return True
+    
+    def pipeline(self, transaction=True):
+        return MockPipeline(self)
+
+class MockPipeline:
+    """
+    Mock Redis pipeline that queues commands and runs them on execute
+    """
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+    
+    def get(self, key):
+        self.commands.append((self.client.get, (key,), {}))
+        return self
+    
+    def set(self, key, value, ex=None):
+        self.commands.append((self.client.set, (key, value), {"ex": ex}))
+        return self
+    
+    def delete(self, key):
+        self.commands.append((self.client.delete, (key,), {}))
+        return self
+    
+    def execute(self):
+        commands, self.commands = self.commands, []
+        return [command(*args, **kwargs) for command, args, kwargs in commands]
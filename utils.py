@@ -1,11 +1,16 @@
 import os
+import hashlib
+import numpy as np
+from functools import lru_cache
 import streamlit as st
 from openai import OpenAI
 from datetime import datetime
 
+@st.cache_resource(show_spinner=False)
 def get_openai_client():
     """
     Centralized function to get OpenAI client with proper error handling
+    The client (and its HTTP connection pool) is created once per process
     """
     try:
         # Try to get API key from Streamlit secrets first
@@ -23,25 +28,74 @@ def get_openai_client():
         st.error(f"❌ Error initializing OpenAI client: {str(e)}")
         return None
 
+# Page stylesheets live in static/ and are read once, then served from cache
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+@st.cache_data(show_spinner=False)
+def load_css(filename):
+    """
+    Load a stylesheet from the static directory
+    """
+    with open(os.path.join(STATIC_DIR, filename), encoding="utf-8") as f:
+        return f.read()
+
+def parse_iso_date(date_str, separators="-/"):
+    """
+    Fast path for "YYYY-MM-DD" and "YYYY-MM-DD HH:MM:SS" (with any of the given date separators)
+    Returns None for anything else so callers can fall back to strptime
+    """
+    length = len(date_str)
+    if length != 10 and length != 19:
+        return None
+    
+    separator = date_str[4]
+    if separator not in separators or date_str[7] != separator:
+        return None
+    if length == 19 and (date_str[10] != " " or date_str[13] != ":" or date_str[16] != ":"):
+        return None
+    
+    try:
+        return datetime.fromisoformat(date_str.replace(separator, "-", 2))
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=4096)
+def _format_datetime_str(dt):
+    """
+    Format a date string for display (cached, as the same timestamps are rendered on every rerun)
+    """
+    dt_obj = parse_iso_date(dt, "-")
+    if dt_obj is not None:
+        return dt_obj.strftime("%b %d, %Y %H:%M" if len(dt) == 19 else "%b %d, %Y")
+    
+    try:
+        dt_obj = datetime.strptime(dt, "%Y-%m-%d %H:%M:%S")
+        return dt_obj.strftime("%b %d, %Y %H:%M")
+    except ValueError:
+        try:
+            dt_obj = datetime.strptime(dt, "%Y-%m-%d")
+            return dt_obj.strftime("%b %d, %Y")
+        except ValueError:
+            return dt
+
 def format_datetime(dt):
     """
     Format a datetime object or string for display
     """
     if isinstance(dt, str):
-        try:
-            dt_obj = datetime.strptime(dt, "%Y-%m-%d %H:%M:%S")
-            return dt_obj.strftime("%b %d, %Y %H:%M")
-        except ValueError:
-            try:
-                dt_obj = datetime.strptime(dt, "%Y-%m-%d")
-                return dt_obj.strftime("%b %d, %Y")
-            except ValueError:
-                return dt
+        return _format_datetime_str(dt)
     elif isinstance(dt, datetime):
         return dt.strftime("%b %d, %Y %H:%M")
     else:
         return str(dt)
 
+def stable_hash(text, digest_size=8):
+    """
+    Hash text to a short hex digest that is the same across processes
+    (unlike the builtin hash, which is randomized per interpreter run)
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=digest_size).hexdigest()
+
 def truncate_text(text, max_length=100):
     """
     Truncate text to a maximum length and add ellipsis
@@ -67,6 +121,13 @@ def format_risk_score(risk_score):
     except (ValueError, TypeError):
         return str(risk_score)
 
+# Highest threshold first; scores below the last one are green
+RISK_COLOR_THRESHOLDS = ((0.8, "red"), (0.6, "orange"), (0.4, "yellow"))
+
+# Bucket edges and colors for scoring whole columns at once (same buckets as above)
+RISK_COLOR_BINS = np.array([0.4, 0.6, 0.8])
+RISK_COLOR_NAMES = np.array(["green", "yellow", "orange", "red"])
+
 def get_risk_color(risk_score):
     """
     Get a color based on risk score
@@ -76,33 +137,52 @@ def get_risk_color(risk_score):
     
     try:
         score = float(risk_score)
-        if score >= 0.8:
-            return "red"
-        elif score >= 0.6:
-            return "orange"
-        elif score >= 0.4:
-            return "yellow"
-        else:
-            return "green"
     except (ValueError, TypeError):
         return "gray"
+    
+    for threshold, color in RISK_COLOR_THRESHOLDS:
+        if score >= threshold:
+            return color
+    return "green"
+
+def get_risk_colors(risk_scores, palette=RISK_COLOR_NAMES, missing="gray"):
+    """
+    Get colors for an array of risk scores in one vectorized lookup
+    palette holds one color per bucket, lowest risk first; NaN scores get the missing color
+    """
+    scores = np.asarray(risk_scores, dtype=float)
+    colors = np.asarray(palette)[np.digitize(scores, RISK_COLOR_BINS)]
+    return np.where(np.isnan(scores), missing, colors)
+
+def format_risk_scores(risk_scores):
+    """
+    Format an array of risk scores for display in one vectorized call
+    """
+    scores = np.asarray(risk_scores, dtype=float)
+    return np.where(np.isnan(scores), "Unknown", np.char.mod("%.2f", scores))
 
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%d-%m-%Y",
+    "%d/%m/%Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y/%m/%d %H:%M:%S"
+)
+
+@lru_cache(maxsize=8192)
 def parse_date(date_str):
     """
-    Parse a date string into a datetime object
-    """
-    date_formats = [
-        "%Y-%m-%d",
-        "%Y/%m/%d",
-        "%d-%m-%Y",
-        "%d/%m/%Y",
-        "%b %d, %Y",
-        "%B %d, %Y",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y/%m/%d %H:%M:%S"
-    ]
+    Parse a date string into a datetime object (cached, datetimes are immutable)
+    """
+    # Zero-padded ISO dates are the common case and skip the strptime loop
+    parsed = parse_iso_date(date_str)
+    if parsed is not None:
+        return parsed
     
-    for fmt in date_formats:
+    for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
@@ -111,6 +191,14 @@ def parse_date(date_str):
     # If all formats fail, return None
     return None
 
+JURISDICTION_NAMES = {
+    "US": "United States",
+    "EU": "European Union",
+    "INDIA": "India",
+    "ASIA": "Asia Pacific",
+    "GLOBAL": "Global"
+}
+
 def format_jurisdiction(jurisdiction):
     """
     Format a jurisdiction code for display
@@ -119,16 +207,4 @@ def format_jurisdiction(jurisdiction):
         return "Unknown"
     
     jurisdiction = str(jurisdiction).upper()
-    
-    if jurisdiction == "US":
-        return "United States"
-    elif jurisdiction == "EU":
-        return "European Union"
-    elif jurisdiction == "INDIA":
-        return "India"
-    elif jurisdiction == "ASIA":
-        return "Asia Pacific"
-    elif jurisdiction == "GLOBAL":
-        return "Global"
-    else:
-        return jurisdiction
+    return JURISDICTION_NAMES.get(jurisdiction, jurisdiction)
\ No newline at end of file
@@ -1,15 +1,31 @@
 import os
 import json
 import time
-import math
+import re
+import asyncio
+from collections import Counter, namedtuple
 import numpy as np
 from datetime import datetime
 import threading
+from openai import AsyncOpenAI
+from concurrent.futures import ThreadPoolExecutor
 import redis
-from redis_cache import get_redis_client, get_cached_result, cache_result
-from utils import format_datetime, get_openai_client
+from redis_cache import get_redis_client, get_cached_result, cache_result, get_cached_many, cache_many
+from utils import format_datetime, get_openai_client, stable_hash
 import streamlit as st
 
+# SimSIMD is optional; it gives a SIMD cosine kernel for float32 vectors
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+# Faiss is optional; it gives an approximate nearest neighbour index for large corpora
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
 # Initialize OpenAI client
 client = get_openai_client()
 
@@ -17,62 +33,422 @@ client = get_openai_client()
 # In a production environment, this would be a persistent vector database
 documents = {}
 document_embeddings = {}
-keyword_index = {}
+keyword_index = {}  # Inverted index for BM25: term -> {doc_id: term frequency}
+document_terms = {}  # doc_id -> term frequencies, used to retract postings when a document is replaced
+document_lengths = {}  # doc_id -> number of tokens
+total_document_length = 0
+jurisdiction_index = {}
+last_update_time = 0.0
 locks = {
     "documents": threading.Lock(),
     "embeddings": threading.Lock(),
     "keywords": threading.Lock()
 }
 
+# Stacked (already normalized) document embeddings so a query scores every document in a
+# single matrix-vector product, plus per-row jurisdictions and token counts; rebuilt on
+# the first query after the index changes. With SimSIMD the scan runs on an int8 copy
+# of the matrix (one scale per row), a quarter of the memory traffic, and the returned
+# top_k are rescored in float32. postings caches each queried term's (rows, tf) arrays.
+# ann is the HNSW graph over the matrix rows when the corpus is large enough to use it.
+# jurisdiction_rows and avg_length are precomputed so queries don't rescan every row.
+EMBEDDING_DIM = 1536
+EmbeddingIndex = namedtuple(
+    "EmbeddingIndex",
+    ["ids", "rows", "docs", "matrix", "jurisdictions", "lengths", "quantized", "postings", "ann", "jurisdiction_rows", "avg_length"]
+)
+
+def _empty_embedding_index():
+    return EmbeddingIndex(
+        [], {}, {}, np.zeros((0, EMBEDDING_DIM), dtype=np.float32), np.array([], dtype=object), np.zeros(0), None, {}, None, {}, 1.0
+    )
+
+embedding_index = _empty_embedding_index()
+embedding_matrix_dirty = False
+
+# Readers work on immutable copy-on-write snapshots instead of locking per document:
+# the current snapshot is swapped in as a whole (a single atomic reference update)
+# and rebuilt under the lock only after writers mark it dirty
+DocumentSnapshot = namedtuple("DocumentSnapshot", ["docs", "by_jurisdiction"])
+documents_snapshot = DocumentSnapshot({}, {})
+documents_dirty = False
+
+# Large indexes are scanned in parallel row blocks (numpy and SimSIMD release the GIL)
+PARALLEL_SCAN_MIN_ROWS = 10_000
+SCAN_WORKERS = os.cpu_count() or 1
+scan_executor = ThreadPoolExecutor(max_workers=SCAN_WORKERS, thread_name_prefix="vector-scan")
+
+# Past RERANK_MIN_ROWS eligible documents, only the RERANK_CANDIDATE_FACTOR * top_k best
+# vector matches and as many best keyword matches are fused; smaller collections score
+# every document.
+RERANK_MIN_ROWS = 10_000
+RERANK_CANDIDATE_FACTOR = 4
+
+# With Faiss, queries over at least ANN_MIN_ROWS documents search an HNSW graph for
+# RERANK_CANDIDATE_FACTOR * top_k neighbours, add the best keyword matches and score only
+# those candidates exactly instead of scanning every row. Rows are only ever appended,
+# so the graph is extended in place; when a stored embedding actually changes, a new
+# graph is built on a background thread while queries keep using the current one (or
+# the exact scan, before the first graph is ready). ann_lock keeps searches from
+# running during an extension.
+ANN_MIN_ROWS = 50_000
+HNSW_M = 32
+HNSW_EF_SEARCH = 64
+ann_graph = None
+ann_graph_stale = False
+ann_graph_building = False
+ann_lock = threading.Lock()
+
 def generate_embedding(text):
     """
     Generate embedding vector for text using OpenAI
     """
+    return generate_embeddings_batch([text])[0]
+
+async def agenerate_embedding(text):
+    """
+    Generate embedding vector for text from code already running an event loop
+    """
+    return (await asyncio.to_thread(generate_embeddings_batch, [text]))[0]
+
+# Texts are embedded EMBEDDING_BATCH_SIZE per request (well inside the endpoint's 2048
+# inputs and token budget per request); when there are several requests to make, up to
+# EMBEDDING_MAX_CONCURRENCY of them are in flight at once
+EMBEDDING_BATCH_SIZE = 256
+EMBEDDING_MAX_CONCURRENCY = 16
+
+async def _embed_batch_async(aclient, semaphore, texts):
+    """
+    Embed one batch of texts, waiting for a free request slot first
+    """
+    async with semaphore:
+        try:
+            response = await aclient.embeddings.create(model="text-embedding-ada-002", input=texts)
+            return [item.embedding for item in response.data]
+        except Exception as e:
+            print(f"Error generating embeddings: {str(e)}")
+            return None
+
+async def _embed_batches_async(batches):
+    """
+    Embed several batches of texts concurrently
+    Returns each batch's embeddings in order (None for a batch that failed)
+    """
+    semaphore = asyncio.Semaphore(EMBEDDING_MAX_CONCURRENCY)
+    
+    # The async client is tied to this event loop, so open and close it per run
+    async with AsyncOpenAI(api_key=client.api_key) as aclient:
+        return await asyncio.gather(*[_embed_batch_async(aclient, semaphore, texts) for texts in batches])
+
+def _embed_batch(texts):
+    """
+    Embed one batch of texts with the shared client (None if the request failed)
+    """
     try:
-        # Check cache first
-        cache_key = f"embedding:{hash(text)}"
-        cached_embedding = get_cached_result(cache_key)
+        response = client.embeddings.create(model="text-embedding-ada-002", input=texts)
+        return [item.embedding for item in response.data]
+    except Exception as e:
+        print(f"Error generating embeddings: {str(e)}")
+        return None
+
+def generate_embeddings_batch(texts):
+    """
+    Generate embedding vectors for several texts, with one cache round-trip and one OpenAI request per batch
+    Returns the embeddings as float32 arrays in the same order as texts
+    """
+    if not texts:
+        return []
+    
+    # Keyed by a stable digest so cached embeddings survive restarts; v2 entries hold
+    # the raw float32 bytes, so a cache hit is a zero-copy view instead of a JSON parse
+    cache_keys = [f"embedding:v2:{stable_hash(text, digest_size=16)}" for text in texts]
+    embeddings = {}
+    for key, cached_embedding in zip(cache_keys, get_cached_many(cache_keys)):
         if cached_embedding:
-            return json.loads(cached_embedding)
+            embeddings[key] = np.frombuffer(cached_embedding, dtype=np.float32)
+    
+    # Each distinct uncached text is embedded once
+    missing = {}
+    for key, text in zip(cache_keys, texts):
+        if key not in embeddings:
+            missing.setdefault(key, text)
+    
+    if missing and client:
+        missing_keys = list(missing)
+        batch_keys = [missing_keys[start:start + EMBEDDING_BATCH_SIZE] for start in range(0, len(missing_keys), EMBEDDING_BATCH_SIZE)]
+        batches = [[missing[key] for key in keys] for keys in batch_keys]
         
-        if not client:
-            # Return zero vector if OpenAI client is not available
-            return [0.0] * 1536  # Ada embeddings are 1536 dimensions
-            
-        # Generate new embedding
-        response = client.embeddings.create(
-            model="text-embedding-ada-002",
-            input=text
-        )
-        embedding = response.data[0].embedding
+        # A single request reuses the shared client's pooled connection; several overlap their round-trips
+        if len(batches) == 1:
+            batch_results = [_embed_batch(batches[0])]
+        else:
+            batch_results = asyncio.run(_embed_batches_async(batches))
         
-        # Cache the result
-        cache_result(cache_key, json.dumps(embedding))
+        new_embeddings = {}
+        for keys, batch_result in zip(batch_keys, batch_results):
+            if batch_result is not None:
+                new_embeddings.update(
+                    (key, np.asarray(embedding, dtype=np.float32)) for key, embedding in zip(keys, batch_result)
+                )
+        if new_embeddings:
+            embeddings.update(new_embeddings)
+            cache_many({key: embedding.tobytes() for key, embedding in new_embeddings.items()})
+    
+    # Zero vectors stand in for anything that could not be embedded
+    return [embeddings[key] if key in embeddings else np.zeros(EMBEDDING_DIM, dtype=np.float32) for key in cache_keys]
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+def tokenize(text):
+    """
+    Split lowercased text into word tokens for keyword matching
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+def _index_terms(doc_id, term_counts):
+    """
+    Add a document's term frequencies to the inverted index, replacing any previous version
+    """
+    global total_document_length
+    
+    with locks["keywords"]:
+        for term in document_terms.get(doc_id, ()):
+            postings = keyword_index.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del keyword_index[term]
+        total_document_length -= document_lengths.get(doc_id, 0)
         
-        return embedding
-    except Exception as e:
-        print(f"Error generating embedding: {str(e)}")
-        # Return a zero vector as fallback
-        return [0.0] * 1536  # Ada embeddings are 1536 dimensions
+        for term, count in term_counts.items():
+            keyword_index.setdefault(term, {})[doc_id] = count
+        document_terms[doc_id] = term_counts
+        document_lengths[doc_id] = sum(term_counts.values())
+        total_document_length += document_lengths[doc_id]
 
-def update_vector_index(document_id, content):
+def _add_search_fields(record):
     """
-    Update the vector index with new document embeddings
-    For demo purposes, this just returns the content
-    In production, this would use a vector database
+    Precompute the lowercased text and term frequencies used by keyword filtering and scoring
+    Done once per document so queries don't re-lowercase or re-tokenize the content every time
     """
+    content_lower = record["content"].lower()
+    record["_content_lower"] = content_lower
+    record["_tf"] = Counter(TOKEN_PATTERN.findall(content_lower))
+    record["_len"] = sum(record["_tf"].values())
+    record["_title_lower"] = (record.get("title") or "").lower()
+    record["_keywords_lower"] = tuple(keyword.lower() for keyword in record.get("keywords") or ())
+    return record
+
+def update_vector_index(document, embedding=None):
+    """
+    Add or update a document in the hybrid index
+    Also maintains the per-jurisdiction partitions used to pre-filter queries
+    Pass embedding if it was already computed for the document's content
+    """
+    global last_update_time, embedding_matrix_dirty, documents_dirty, ann_graph_stale
+    
     try:
-        # In a production environment, we would:
-        # 1. Generate embeddings using OpenAI
-        # 2. Store them in a vector database
-        # 3. Update the index
+        doc_id = document["id"]
+        content = document.get("content", "")
+        
+        # Normalize the different source schemas into a single record
+        record = {
+            "id": doc_id,
+            "title": document.get("title") or f"{document.get('form_type', '')} for {document.get('company', '')}",
+            "date": document.get("date") or document.get("filing_date") or document.get("published_date", ""),
+            "source": document.get("source", "Unknown"),
+            "jurisdiction": document.get("jurisdiction") or "GLOBAL",
+            "risk_score": document.get("risk_score", 0.0),
+            "keywords": document.get("keywords") or [],
+            "content": content,
+            "timestamp": time.time()
+        }
+        _add_search_fields(record)
+        
+        if embedding is None:
+            embedding = generate_embedding(content)
+        
+        with locks["documents"]:
+            previous = documents.get(doc_id)
+            if previous and previous["jurisdiction"] != record["jurisdiction"]:
+                jurisdiction_index[previous["jurisdiction"]].discard(doc_id)
+            documents[doc_id] = record
+            jurisdiction_index.setdefault(record["jurisdiction"], set()).add(doc_id)
+            last_update_time = record["timestamp"]
+            documents_dirty = True
+        
+        _index_terms(doc_id, record["_tf"])
+        
+        # Stored as unit-length float32 vectors, so cosine similarity is a plain dot product
+        vector = _normalize(np.asarray(embedding, dtype=np.float32))
+        
+        with locks["embeddings"]:
+            # A changed row can't be updated in the HNSW graph, so it has to be rebuilt
+            previous = document_embeddings.get(doc_id)
+            if previous is not None and not np.array_equal(previous, vector):
+                ann_graph_stale = True
+            document_embeddings[doc_id] = vector
+            embedding_matrix_dirty = True
         
-        # For demo, just return success
         return True
     except Exception as e:
         print(f"Error updating vector index: {str(e)}")
         return False
 
+def _normalize(vector):
+    """
+    Scale a vector to unit L2 norm, leaving an all-zero vector as zeros
+    """
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+def _get_documents_snapshot():
+    """
+    Get the current read-only snapshot of the documents and jurisdiction partitions
+    """
+    global documents_snapshot, documents_dirty
+    
+    if documents_dirty:
+        with locks["documents"]:
+            if documents_dirty:
+                documents_snapshot = DocumentSnapshot(
+                    dict(documents),
+                    {jurisdiction: frozenset(doc_ids) for jurisdiction, doc_ids in jurisdiction_index.items()}
+                )
+                documents_dirty = False
+    return documents_snapshot
+
+def _get_embedding_index():
+    """
+    Get the stacked embedding index, rebuilding it if the documents changed
+    """
+    global embedding_index, embedding_matrix_dirty
+    
+    # Lock-free when nothing changed since the last rebuild
+    if not embedding_matrix_dirty:
+        return embedding_index
+    
+    with locks["embeddings"]:
+        if embedding_matrix_dirty:
+            ids = list(document_embeddings.keys())
+            if ids:
+                matrix = np.vstack([document_embeddings[doc_id] for doc_id in ids])
+                docs = _get_documents_snapshot().docs
+                jurisdictions = np.array(
+                    [docs[doc_id]["jurisdiction"] if doc_id in docs else None for doc_id in ids],
+                    dtype=object
+                )
+                with locks["keywords"]:
+                    lengths = np.array([document_lengths.get(doc_id, 0) for doc_id in ids], dtype=float)
+                embedding_index = EmbeddingIndex(
+                    ids,
+                    {doc_id: row for row, doc_id in enumerate(ids)},
+                    docs,
+                    matrix,
+                    jurisdictions,
+                    lengths,
+                    _quantize(matrix) if simsimd is not None else None,
+                    {},
+                    _update_ann_graph(matrix) if faiss is not None and len(ids) >= ANN_MIN_ROWS else None,
+                    {jurisdiction: np.flatnonzero(jurisdictions == jurisdiction) for jurisdiction in set(jurisdictions)},
+                    lengths.mean() or 1.0
+                )
+            else:
+                embedding_index = _empty_embedding_index()
+            embedding_matrix_dirty = False
+        return embedding_index
+
+def _update_ann_graph(matrix):
+    """
+    Bring the HNSW graph up to date with the embedding matrix (called under the embeddings lock)
+    New rows are added in place; a full rebuild is started in the background instead of blocking here
+    """
+    global ann_graph_stale, ann_graph_building
+    
+    if (ann_graph is None or ann_graph_stale) and not ann_graph_building:
+        ann_graph_building = True
+        ann_graph_stale = False
+        threading.Thread(target=_build_ann_graph, args=(matrix,), name="ann-build", daemon=True).start()
+    
+    if ann_graph is not None and ann_graph.ntotal < len(matrix):
+        with ann_lock:
+            ann_graph.add(matrix[ann_graph.ntotal:])
+    return ann_graph
+
+def _build_ann_graph(matrix):
+    """
+    Build a new HNSW graph over matrix and swap it in at the next index rebuild
+    """
+    global ann_graph, ann_graph_building, embedding_matrix_dirty
+    
+    try:
+        graph = faiss.IndexHNSWFlat(matrix.shape[1], HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        graph.add(matrix)
+    except Exception as e:
+        print(f"Error building ANN index: {str(e)}")
+        graph = None
+    
+    with locks["embeddings"]:
+        if graph is not None:
+            ann_graph = graph
+            # Rebuild the index on the next query so it uses the new graph (and adds rows indexed meanwhile)
+            embedding_matrix_dirty = True
+        ann_graph_building = False
+
+def _ann_candidates(index, query_vector, query_terms, rows, top_k, jurisdiction=None):
+    """
+    Get the rows worth scoring exactly: the query's approximate nearest neighbours
+    plus the rows with the best keyword scores, limited to rows when a jurisdiction is given
+    """
+    k = min(RERANK_CANDIDATE_FACTOR * top_k, len(rows) if jurisdiction else len(index.ids))
+    if k <= 0:
+        return np.zeros(0, dtype=np.intp)
+    
+    params = faiss.SearchParametersHNSW(efSearch=max(HNSW_EF_SEARCH, k))
+    if jurisdiction:
+        # Keep a reference to the selector; the search parameters don't own it
+        selector = faiss.IDSelectorBatch(rows)
+        params.sel = selector
+    
+    with ann_lock:
+        _, labels = index.ann.search(query_vector[None, :], k, params=params)
+    
+    # The graph may already hold rows appended after this index was built
+    labels = labels[0]
+    ann_rows = labels[(labels >= 0) & (labels < len(index.ids))]
+    
+    return np.union1d(ann_rows, bm25_top_rows(index, query_terms, k, jurisdiction))
+
+def _quantize(matrix):
+    """
+    Quantize each row to int8 with its own scale (row * scale ~ int8 values)
+    """
+    peaks = np.abs(matrix).max(axis=1)
+    scales = 127.0 / np.where(peaks == 0, 1, peaks)
+    return np.round(matrix * scales[:, None]).astype(np.int8), scales
+
+def _vector_scores(query_vector, matrix, quantized=None):
+    """
+    Dot products of a normalized query with every row of the normalized embedding matrix
+    """
+    if not len(matrix):
+        return np.zeros(0, dtype=np.float32)
+    
+    parallel = SCAN_WORKERS > 1 and len(matrix) >= PARALLEL_SCAN_MIN_ROWS
+    
+    if quantized is None:
+        if not parallel:
+            return matrix @ query_vector
+        blocks = np.array_split(matrix, SCAN_WORKERS)
+        return np.concatenate(list(scan_executor.map(lambda block: block @ query_vector, blocks)))
+    
+    matrix_int8, scales = quantized
+    query_int8, query_scale = _quantize(query_vector[None, :])
+    dots = np.asarray(simsimd.cdist(
+        query_int8, matrix_int8, metric="dot", dtype="int8", threads=SCAN_WORKERS if parallel else 1
+    ))[0]
+    return dots / (query_scale[0] * scales)
+
 def search_similar_documents(query, top_k=5):
     """
     Search for similar documents using vector similarity
@@ -97,14 +473,22 @@ def vector_similarity(vec1, vec2):
     """
     Calculate cosine similarity between two vectors
     """
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
-    magnitude1 = math.sqrt(sum(a * a for a in vec1))
-    magnitude2 = math.sqrt(sum(b * b for b in vec2))
+    vec1 = np.asarray(vec1, dtype=np.float32)
+    vec2 = np.asarray(vec2, dtype=np.float32)
+    
+    if simsimd is not None:
+        # SimSIMD reports two zero vectors as identical; treat them as unrelated instead
+        if not vec1.any() or not vec2.any():
+            return 0
+        return 1.0 - float(simsimd.cosine(vec1, vec2))
+    
+    magnitude1 = np.linalg.norm(vec1)
+    magnitude2 = np.linalg.norm(vec2)
     
     if magnitude1 == 0 or magnitude2 == 0:
         return 0
     
-    return dot_product / (magnitude1 * magnitude2)
+    return float(np.dot(vec1, vec2) / (magnitude1 * magnitude2))
 
 def bm25_score(query_terms, document, k1=1.5, b=0.75, avg_doc_len=None):
     """
@@ -113,106 +497,207 @@ def bm25_score(query_terms, document, k1=1.5, b=0.75, avg_doc_len=None):
     if not query_terms or not document:
         return 0
     
-    # Extract document content and terms
-    doc_content = document["content"].lower()
-    doc_terms = set(doc_content.split())
+    # Term frequencies and length are precomputed for indexed documents
+    if "_tf" not in document:
+        _add_search_fields(document)
+    doc_tf = document["_tf"]
+    doc_len = document["_len"]
     
     # If no average document length is provided, use this document's length
-    if avg_doc_len is None:
-        avg_doc_len = len(doc_terms)
+    term_score = make_bm25(k1, b, avg_doc_len or doc_len or 1)
     
-    # Calculate IDF and term frequency components
+    # We don't have a corpus IDF, so use a simplified approach
+    # Assume all query terms are equally important
     score = 0
     for term in query_terms:
-        if term in doc_terms:
-            # Term frequency in the document
-            tf = doc_content.count(term)
-            
-            # Document length normalization
-            doc_len = len(doc_terms)
-            norm_factor = 1 - b + b * (doc_len / avg_doc_len)
-            
-            # BM25 formula component
-            term_score = tf * (k1 + 1) / (tf + k1 * norm_factor)
-            
-            # We don't have a corpus IDF, so use a simplified approach
-            # Assume all query terms are equally important
-            score += term_score
+        tf = doc_tf.get(term, 0)
+        if tf:
+            score += term_score(tf, doc_len)
+    
+    return score
+
+def _term_postings(index, term):
+    """
+    Get the rows and term frequencies of the documents in the index that contain term
+    """
+    postings = index.postings.get(term)
+    if postings is None:
+        with locks["keywords"]:
+            matches = [(index.rows[doc_id], tf) for doc_id, tf in keyword_index.get(term, {}).items() if doc_id in index.rows]
+        # Sorted by row so the frequencies of given rows can be found with a binary search
+        matches.sort()
+        postings = (
+            np.array([row for row, _ in matches], dtype=np.intp),
+            np.array([tf for _, tf in matches], dtype=float)
+        )
+        index.postings[term] = postings
+    return postings
+
+def make_bm25(k1, b, avg_doc_len):
+    """
+    Build a BM25 term scorer with the constants for one query folded in
+    tf * (k1 + 1) / (tf + k1 * (1 - b + b * doc_len / avg_doc_len)) becomes tf * c1 / (tf + c2 + c3 * doc_len)
+    """
+    c1 = k1 + 1
+    c2 = k1 * (1 - b)
+    c3 = k1 * b / avg_doc_len
+    
+    def score(tf, doc_lengths):
+        return tf * c1 / (tf + c2 + c3 * doc_lengths)
     
     return score
 
+def bm25_scores(index, query_terms, k1=1.5, b=0.75, rows=None):
+    """
+    Calculate BM25 scores for every row of the embedding index (or only the given rows) from the inverted index
+    Each query term is scored over its postings in one vectorized step
+    """
+    scores = np.zeros(len(index.ids) if rows is None else len(rows))
+    if not index.ids:
+        return scores
+    
+    # Document length normalization against the corpus average
+    term_score = make_bm25(k1, b, index.avg_length)
+    
+    # We don't have a meaningful corpus IDF, so all query terms are weighted equally
+    for term in query_terms:
+        term_rows, tf = _term_postings(index, term)
+        if rows is None:
+            scores[term_rows] += term_score(tf, index.lengths[term_rows])
+        elif len(term_rows):
+            # Look the requested rows up in the sorted postings
+            positions = np.minimum(np.searchsorted(term_rows, rows), len(term_rows) - 1)
+            found = term_rows[positions] == rows
+            scores[found] += term_score(tf[positions[found]], index.lengths[rows[found]])
+    
+    return scores
+
+def bm25_top_rows(index, query_terms, k, jurisdiction=None, k1=1.5, b=0.75):
+    """
+    Get the (up to) k rows with the best BM25 scores, optionally within a jurisdiction
+    Only the query terms' postings are scored, so the cost doesn't grow with the index
+    """
+    postings = [_term_postings(index, term) for term in query_terms]
+    postings = [(term_rows, tf) for term_rows, tf in postings if len(term_rows)]
+    if not postings or k <= 0:
+        return np.zeros(0, dtype=np.intp)
+    
+    # Sum the per-term scores of each row that contains any query term
+    term_score = make_bm25(k1, b, index.avg_length)
+    rows, inverse = np.unique(np.concatenate([term_rows for term_rows, _ in postings]), return_inverse=True)
+    scores = np.bincount(
+        inverse,
+        weights=np.concatenate([term_score(tf, index.lengths[term_rows]) for term_rows, tf in postings])
+    )
+    
+    if jurisdiction:
+        eligible = index.jurisdictions[rows] == jurisdiction
+        rows, scores = rows[eligible], scores[eligible]
+    
+    if len(rows) > k:
+        rows = rows[np.argpartition(scores, -k)[-k:]]
+    return rows
+
 def query_hybrid_index(query, jurisdiction=None, top_k=5):
     """
     Query the hybrid index (vector + keyword) with a given query
     """
     # Check cache first
-    cache_key = f"query:{query}:{jurisdiction}:{top_k}"
+    cache_key = f"query:{stable_hash(json.dumps([query, jurisdiction, top_k]), digest_size=16)}"
     cached_results = get_cached_result(cache_key)
     if cached_results:
         return json.loads(cached_results)
     
-    # Generate embedding for the query
-    query_embedding = generate_embedding(query)
+    # Generate embedding for the query and normalize it once
+    query_vector = _normalize(np.asarray(generate_embedding(query), dtype=np.float32))
     
-    # Calculate similarity scores for all documents
-    results = []
+    index = _get_embedding_index()
+    ids, matrix, quantized = index.ids, index.matrix, index.quantized
     
-    with locks["documents"]:
-        doc_ids = list(documents.keys())
+    # Only documents in the requested jurisdiction are scored
+    if jurisdiction:
+        rows = index.jurisdiction_rows.get(jurisdiction, np.zeros(0, dtype=np.intp))
+    else:
+        rows = None
     
-    # Extract query terms for keyword matching
-    query_terms = set(query.lower().split())
+    # Keyword scores come from the postings of the query terms only
+    query_terms = set(tokenize(query))
     
-    for doc_id in doc_ids:
-        with locks["documents"]:
-            doc = documents.get(doc_id)
-        
-        if not doc:
-            continue
-        
-        # Filter by jurisdiction if specified
-        if jurisdiction and doc["jurisdiction"] != jurisdiction:
-            continue
+    if index.ann is not None and (len(rows) if jurisdiction else len(ids)) >= ANN_MIN_ROWS:
+        # Large corpus: exact scores for the approximate neighbours and best keyword matches only
+        rows = _ann_candidates(index, query_vector, query_terms, rows, top_k, jurisdiction)
+        vector_scores = matrix[rows] @ query_vector
+        keyword_scores = bm25_scores(index, query_terms, rows=rows)
+        quantized = None
+    else:
+        # Cosine similarity against every candidate document in one matrix-vector product
+        if rows is None:
+            rows = np.arange(len(ids))
+            vector_scores = _vector_scores(query_vector, matrix, quantized)
+        else:
+            # Only the jurisdiction's partition is scanned
+            vector_scores = _vector_scores(
+                query_vector,
+                matrix[rows],
+                (quantized[0][rows], quantized[1][rows]) if quantized is not None else None
+            )
         
-        # Get document embedding
-        with locks["embeddings"]:
-            doc_embedding = document_embeddings.get(doc_id)
+        # Large collections only fuse the best vector matches and the best keyword matches
+        n_candidates = RERANK_CANDIDATE_FACTOR * top_k
+        if len(rows) >= RERANK_MIN_ROWS and 0 < n_candidates < len(rows):
+            best = np.argpartition(vector_scores, -n_candidates)[-n_candidates:]
+            # rows is sorted, so the keyword rows' positions are found by binary search
+            keyword_best = np.searchsorted(rows, bm25_top_rows(index, query_terms, n_candidates, jurisdiction))
+            best = np.union1d(best, keyword_best)
+            rows, vector_scores = rows[best], vector_scores[best]
+            keyword_scores = bm25_scores(index, query_terms, rows=rows)
+        else:
+            keyword_scores = bm25_scores(index, query_terms)[rows]
+    
+    candidates = [index.docs.get(ids[row]) for row in rows]
+    
+    # Combined score - 70% vector similarity, 30% keyword matching
+    combined_scores = 0.7 * vector_scores + 0.3 * keyword_scores
+    
+    # Select the top_k without sorting every score
+    k = min(top_k, len(rows))
+    if k > 0:
+        top = np.argpartition(combined_scores, -k)[-k:]
+        top = top[np.argsort(combined_scores[top])[::-1]]
         
-        if not doc_embedding:
+        # The int8 scan only ranks candidates; report exact scores for the ones returned
+        if quantized is not None:
+            combined_scores[top] = 0.7 * (matrix[rows[top]] @ query_vector) + 0.3 * keyword_scores[top]
+            top = top[np.argsort(combined_scores[top])[::-1]]
+    else:
+        top = []
+    
+    results = []
+    for index in top:
+        doc = candidates[index]
+        if not doc:
             continue
-        
-        # Calculate vector similarity score
-        vector_score = vector_similarity(query_embedding, doc_embedding)
-        
-        # Calculate keyword matching score
-        keyword_score = bm25_score(query_terms, doc)
-        
-        # Combined score - 70% vector similarity, 30% keyword matching
-        combined_score = 0.7 * vector_score + 0.3 * keyword_score
-        
-        # Add to results
         results.append({
-            "id": doc_id,
+            "id": doc["id"],
             "title": doc["title"],
             "date": doc["date"],
             "source": doc["source"],
             "jurisdiction": doc["jurisdiction"],
-            "score": combined_score,
+            "score": float(combined_scores[index]),
             "risk_score": doc["risk_score"],
             "excerpt": doc["content"][:200] + "..." if len(doc["content"]) > 200 else doc["content"]
         })
     
-    # Sort by score and take top_k
-    results = sorted(results, key=lambda x: x["score"], reverse=True)[:top_k]
-    
     # Cache results
     cache_result(cache_key, json.dumps(results), ttl=300)  # 5 minutes TTL
     
     return results
 
-def get_latest_documents(jurisdiction=None, min_risk=None, search_query=None, limit=10):
+def get_latest_documents(jurisdiction=None, min_risk=None, search_query=None, limit=10, offset=0, include_content=True):
     """
     Get the latest documents with optional filtering
+    Results are paginated with limit/offset; set include_content=False to
+    leave out the raw document text (fetch it later with get_document)
     """
     # Convert min_risk string to float
     risk_level_map = {
@@ -224,52 +709,75 @@ def get_latest_documents(jurisdiction=None, min_risk=None, search_query=None, li
     
     min_risk_value = risk_level_map.get(min_risk, 0.0) if min_risk else 0.0
     
-    # Build results
-    results = []
+    matches = []
     
-    with locks["documents"]:
-        doc_ids = list(documents.keys())
+    # Work on the current snapshot; only documents in the requested jurisdiction are considered
+    snapshot = _get_documents_snapshot()
+    doc_ids = snapshot.by_jurisdiction.get(jurisdiction, ()) if jurisdiction else snapshot.docs.keys()
+    
+    query_lower = search_query.lower() if search_query else None
     
     for doc_id in doc_ids:
-        with locks["documents"]:
-            doc = documents.get(doc_id)
+        doc = snapshot.docs.get(doc_id)
         
         if not doc:
             continue
         
-        # Filter by jurisdiction if specified
-        if jurisdiction and doc["jurisdiction"] != jurisdiction:
-            continue
-        
-        # Filter by risk level
+        # Filter by risk level before the more expensive text search
         if doc["risk_score"] < min_risk_value:
             continue
         
         # Filter by search query
         if search_query:
-            # Simple text search in title and content
-            query_lower = search_query.lower()
-            title_match = query_lower in doc["title"].lower()
-            content_match = query_lower in doc["content"].lower()
-            keyword_match = any(query_lower in keyword.lower() for keyword in doc["keywords"])
-            
-            if not (title_match or content_match or keyword_match):
+            # Simple text search in title, content and keywords
+            if not (
+                query_lower in doc["_title_lower"]
+                or query_lower in doc["_content_lower"]
+                or any(query_lower in keyword for keyword in doc["_keywords_lower"])
+            ):
                 continue
         
-        # Add to results
-        results.append({
-            "id": doc_id,
+        matches.append(doc)
+    
+    # Sort by timestamp (newest first) and build results for the requested page only
+    matches.sort(key=lambda doc: doc["timestamp"], reverse=True)
+    
+    results = []
+    for doc in matches[offset:offset + limit]:
+        result = {
+            "id": doc["id"],
             "title": doc["title"],
-            "content": doc["content"],
             "date": doc["date"],
             "source": doc["source"],
             "jurisdiction": doc["jurisdiction"],
             "risk_score": doc["risk_score"],
             "keywords": doc["keywords"],
             "summary": doc["content"][:150] + "..." if len(doc["content"]) > 150 else doc["content"]
-        })
-    
-    # Sort by timestamp (newest first) and take the limit
-    results = sorted(results, key=lambda x: documents[x["id"]]["timestamp"], reverse=True)[:limit]
+        }
+        
+        # The raw content dominates the payload size, so only include it on request
+        if include_content:
+            result["content"] = doc["content"]
+        
+        results.append(result)
     
     return results
+
+def get_document(doc_id):
+    """
+    Get a single document by ID
+    """
+    with locks["documents"]:
+        return documents.get(doc_id)
+
+def get_last_update_time():
+    """
+    Get the time the index was last updated (0.0 if it is empty)
+    """
+    return last_update_time
+
+def get_document_risk_scores():
+    """
+    Get the jurisdiction and risk score of every indexed document
+    """
+    return [(doc["jurisdiction"], doc["risk_score"]) for doc in _get_documents_snapshot().docs.values()]